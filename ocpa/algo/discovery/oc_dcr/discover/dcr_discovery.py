@@ -4,7 +4,7 @@ import pandas as pd
 
 import pm4py.utils
 from pm4py.stats import get_event_attribute_values
-from ocpa.util.dcr.converter import dcr_template
+from ocpa.util.dcr.converter import new_dcr_template
 from enum import Enum
 from typing import Tuple, Dict, Set, List, Union
 from pm4py.util import exec_utils, constants, xes_constants
@@ -127,7 +127,7 @@ class Discover:
         Mines DCR constraints from the log abstraction.
     """
     def __init__(self):
-        self.graph = deepcopy(dcr_template)
+        self.graph = new_dcr_template()
         self.logAbstraction = {
             'events': set(),
             'traces': [[]],
@@ -255,8 +255,7 @@ class Discover:
         lastEvent = ''
         for event in trace:
             # All events seen before this one must be predecessors
-            self.logAbstraction['predecessor'][event] = self.logAbstraction['predecessor'].get(event).union(
-                localAtLeastOnce)
+            self.logAbstraction['predecessor'][event].update(localAtLeastOnce)
             # If event seen before in trace, remove from atMostOnce
             if event in localAtLeastOnce:
                 self.logAbstraction['atMostOnce'].discard(event)
@@ -381,7 +380,7 @@ class Discover:
             nonCoExisters.discard(event)
             # Note that if events i & j do not co-exist, they should exclude each other.
             # Here we only add i -->% j, but on the iteration for j, j -->% i will be added.
-            self.graph['excludesTo'][event] = self.graph['excludesTo'][event].union(nonCoExisters)
+            self.graph['excludesTo'][event].update(nonCoExisters)
 
             # if s precedes (event) but never succeeds (event) add (event) -->% s if s -->% s does not exist
             precedesButNeverSucceeds = self.logAbstraction['predecessor'][event].difference(
@@ -415,15 +414,15 @@ class Discover:
                     # Only keep valid conditions
                     possibleConditions[event] = possibleConditions[event].intersection(validConditions)
                     # Execute excludes starting from (event)
-                    included = included.difference(self.graph['excludesTo'][event])
+                    included.difference_update(self.graph['excludesTo'][event])
                     # Execute includes starting from (event)
-                    included = included.union(self.graph['includesTo'][event])
+                    included.update(self.graph['includesTo'][event])
                     localSeenBefore.add(event)
 
             # Now the only possible Condtitions that remain are valid for all traces
             # These are therefore added to the graph
             for key in self.graph['conditionsFor']:
-                self.graph['conditionsFor'][key] = self.graph['conditionsFor'][key].union(possibleConditions[key])
+                self.graph['conditionsFor'][key].update(possibleConditions[key])
 
             # Removing redundant conditions
             self.graph['conditionsFor'] = self.optimizeRelation(self.graph['conditionsFor'])
@@ -130,7 +130,7 @@ class DiscoverData:
         :param obj_type: Name of the object type.
         :return: True if the object type is spawned.
         """
-        return obj_type in self.spawn_mapping.keys()
+        return obj_type in self.spawn_mapping
 
     def is_from_subgraph(self, event: str | Event) -> bool:
         """
@@ -156,7 +156,7 @@ class DiscoverData:
         return {act for act in self.activities_mapping.keys() if self.get_activity_mapping(act) == obj}
 
     def is_spawned_obj_type(self, obj_type: str) -> bool:
-        return obj_type in self.spawn_mapping.keys()
+        return obj_type in self.spawn_mapping
 
 class ErrorManager:
     """
@@ -190,14 +190,12 @@ class ErrorManager:
         Validates object types used in the spawn mapping.
         Also logs warnings for OCEL object types that are not spawned (unspawned).
         """
+        ocel_object_types = set(self.data.ocel.object_types)
         for mapped_object in self.data.get_spawn_obj_types():
-            if mapped_object not in self.data.ocel.object_types:
+            if mapped_object not in ocel_object_types:
                 raise KeyError(f"Object type '{mapped_object}' is no object type in ocel")
 
-        not_mapped_obj_types = set()
-        for object_type in self.data.ocel.object_types:
-            if object_type not in self.data.spawn_mapping.keys():
-                not_mapped_obj_types.add(object_type)
+        not_mapped_obj_types = ocel_object_types - self.data.spawn_mapping.keys()
 
         for object_type in not_mapped_obj_types:
             self.logger.warning(f"Object_type '{object_type}' has no associated spawn activity and will be considerd "
@@ -211,30 +209,31 @@ class ErrorManager:
         - That all mapped activities and object types are valid
         - Warns and auto-fixes activities that are unmapped
         """
+        ocel_activities = self.data.ocel.obj.activities
+        ocel_object_types = set(self.data.ocel.object_types)
+        spawn_activities = set(self.data.spawn_mapping.values())
+
         # Check if all spawn activities exist
         for obj_type, spawn_act in self.data.spawn_mapping.items():
-            if spawn_act not in self.data.ocel.obj.activities:
+            if spawn_act not in ocel_activities:
                 raise KeyError(
                     f"Spawn activity '{spawn_act}' for object type '{obj_type}' not found in OCEL activities")
 
         # Ensure spawn and normal activity mappings do not overlap
-        overlap = set(self.data.spawn_mapping.values()) & set(self.data.activities_mapping.keys())
+        overlap = spawn_activities & self.data.activities_mapping.keys()
         if overlap:
             raise ValueError(f"Activities cannot appear both in spawn_mapping and activities_mapping: {overlap}")
 
         # Check activity-object mapping is consistent with OCEL structure
         for activity, obj_type in self.data.activities_mapping.items():
-            if obj_type not in self.data.ocel.object_types and obj_type != IN_TOP_GRAPH:
+            if obj_type not in ocel_object_types and obj_type != IN_TOP_GRAPH:
                 raise KeyError(f"Object type '{obj_type}' is no object type in ocel")
 
-            if activity not in self.data.ocel.obj.activities:
+            if activity not in ocel_activities:
                 raise KeyError(f"Activity '{activity}' is no activity in ocel")
 
         # Warn and fix unmapped activities
-        not_mapped_activities = set()
-        for activity in self.data.ocel.obj.activities:
-            if activity not in self.data.spawn_mapping.values() and activity not in self.data.activities_mapping.keys():
-                not_mapped_activities.add(activity)
+        not_mapped_activities = ocel_activities - spawn_activities - self.data.activities_mapping.keys()
         for activity in not_mapped_activities:
             self.logger.warning(f"Activity '{activity}' has no associated object type and will be seen as an top "
                                 f"level activity.")
@@ -248,10 +247,11 @@ class ErrorManager:
         """
         if self.data.derived_entities is None:
             return
+        ocel_object_types = set(self.data.ocel.object_types)
         for obj_type1, obj_type2 in self.data.derived_entities:
             if obj_type1 == obj_type2:
                 raise ValueError("Derived Entity Type tupel must contain different types")
-            if obj_type1 not in self.data.ocel.object_types:
+            if obj_type1 not in ocel_object_types:
                 raise ValueError(f"Input '{obj_type1}' is not a object type")
-            if obj_type2 not in self.data.ocel.object_types:
+            if obj_type2 not in ocel_object_types:
                 raise ValueError(f"Input '{obj_type2}' is not a object type")
\ No newline at end of file
@@ -1,12 +1,12 @@
 from pm4py.objects.log.obj import Event
 import pandas as pd
-from typing import Dict, List, Set, Tuple
+from typing import Container, Dict, List, Set, Tuple
 import ocpa.algo.discovery.oc_dcr.discover.dcr_discovery as dis
 
 import networkx as nx
 import polars as pl
 from itertools import combinations
-from collections import defaultdict
+from collections import Counter, defaultdict
 
 #from jupyter.oc_dcr_graph_discovery import object_types
 from ocpa.objects.oc_dcr_graph import OCDCRGraph, DCRGraph, Event, OCDCRRelation, RelationTyps, DCRRelation, \
@@ -15,6 +15,8 @@ from . import SPAWN
 from .graph_optimizations import GraphOptimizations
 from .discover_data import DiscoverData
 
+_NO_OBJECTS = frozenset()
+
 class DiscoverLogic:
     """
     Core logic component providing basic functionalities for the discovery process needed for both the initial discovery and the many to many discovery.
@@ -509,7 +511,7 @@ class ManyToManyDiscovery(DiscoverLogic):
         synchronisation_constraints = DiscoverLogic.apply_dcr_discover(log)
 
         # Get the exclude constraints
-        excludes = {k for k in synchronisation_constraints.relations if k.type == RelationTyps.E}
+        excludes = {k for k in synchronisation_constraints.relations if k.type is RelationTyps.E}
 
         # Add excludes by applying partition on the ocdcr
         oc_dcr.partition(excludes)
@@ -534,7 +536,7 @@ class ManyToManyDiscovery(DiscoverLogic):
         Returns:
             Set of OCDCRRelation objects with universal quantifiers (True, True)
         """
-        if rel_type == RelationTyps.C:
+        if rel_type is RelationTyps.C:
             # Conditions are stored as target → sources
             return {
                 OCDCRRelation(
@@ -571,6 +573,21 @@ class ManyToManyDiscovery(DiscoverLogic):
         # Create lookup set of (activity, object_id) pairs from event_list
         observed_pairs = {(event["concept:name"], event["object_id"] )for event in event_list}
 
+        return self._all_spawned_instances_observed(activity, observed_pairs, spawned_objs)
+
+    @staticmethod
+    def _all_spawned_instances_observed(activity: str, observed_pairs: Container[Tuple[str, str]], spawned_objs: Set[str]) -> bool:
+        """
+        Verifies if all spawned instances of an activity are among the observed (activity, object_id) pairs.
+
+        Args:
+            activity: The activity name to check
+            observed_pairs: Lookup of the observed (activity, object_id) pairs
+            spawned_objs: Set of spawned object IDs
+
+        Returns:
+            True if all required (activity, object_id) pairs are observed, False otherwise.
+        """
         # Check if all required combinations exist
         return all((activity, obj_id) in observed_pairs for obj_id in spawned_objs)
 
@@ -623,30 +640,40 @@ class ManyToManyDiscovery(DiscoverLogic):
             activities: Set of all activities in the log
             log: The event log data as a polars DataFrame
         """
+        # Classify the activities once instead of per trace and per event
+        subgraph_activities = {act for act in activities if self.data.is_from_subgraph(act)}
+        spawn_activities = set(self.data.spawn_mapping.values())
+
         # Process each trace (closure of related objects)
         for trace in log.group_by("case:concept:name"):
             trace = trace[1]  # Get the DataFrame part
             events = trace.sort("time:timestamp").select(["concept:name", "object_id"]).to_dicts()
-            prefix, suffix = [], events.copy()
+            # (activity, object_id) pairs seen before the current event and counts of those still ahead of it,
+            # maintained incrementally instead of rebuilding the lookup sets from the prefix and suffix per check
+            prefix_pairs = set()
+            suffix_pairs = Counter((event["concept:name"], event["object_id"]) for event in events)
             # Track spawned object instances per activity
-            spawned_objects = {act: set() for act in activities if self.data.is_from_subgraph(act)}
+            spawned_objects = {act: set() for act in subgraph_activities}
 
-            while suffix:
-                event = suffix.pop(0)
+            for event in events:
                 activity = event["concept:name"]
+                pair = (activity, event["object_id"])
+                suffix_pairs[pair] -= 1
+                if not suffix_pairs[pair]:
+                    del suffix_pairs[pair]
 
-                if self.data.is_from_subgraph(activity):
+                if activity in subgraph_activities:
                     # Filter conditions - keep only those where all instances appear in prefix -> all spawned instances have performed that activity before the current one
-                    sync_conditions[activity] = { act for act in sync_conditions[activity] if self._all_spawned_instances_in_list(act, prefix, spawned_objects.get(act, set()))}
+                    sync_conditions[activity] = {act for act in sync_conditions[activity] if self._all_spawned_instances_observed(act, prefix_pairs, spawned_objects.get(act, _NO_OBJECTS))}
 
                     # Filter responses - keep only those where all instances appear in suffix  -> all spawned instances will performe that activity after the current one
-                    sync_responses[activity] = {act for act in sync_responses[activity] if self._all_spawned_instances_in_list( act, suffix, spawned_objects.get(act, set()))}
+                    sync_responses[activity] = {act for act in sync_responses[activity] if self._all_spawned_instances_observed(act, suffix_pairs, spawned_objects.get(act, _NO_OBJECTS))}
 
-                elif activity in self.data.spawn_mapping.values():
+                elif activity in spawn_activities:
                     # Track spawned activities for this object instance
                     self._track_spawned_activities(activity, event, spawned_objects)
 
-                prefix.append(event)
+                prefix_pairs.add(pair)
 
     def _track_spawned_activities(self, spawn_activity: str, event: Dict, spawned_objects: Dict[str, Set[str]]) -> None:
         """
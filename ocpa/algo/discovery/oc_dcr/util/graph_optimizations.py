@@ -3,12 +3,15 @@ from typing import Dict, Set, Tuple
 from ocpa.objects.oc_dcr_graph import OCDCRGraph,DCRGraph,OCDCRObject,DCRRelation, RelationTyps,IN_TOP_GRAPH
 
 from collections import defaultdict
+from graphlib import TopologicalSorter, CycleError
 import networkx as nx
 import ocpa.algo.discovery.oc_dcr.discover.extentions.nested as ns
 from ocpa.util.dcr.converter import DCRConverter
 
 from ocpa.algo.discovery.oc_dcr.util import DiscoverData
 
+_NO_CHILDREN = frozenset()
+
 
 class GraphOptimizations:
     """
@@ -65,8 +68,10 @@ class GraphOptimizations:
         optimized_resp = GraphOptimizations._filter_excluded_relations(optimized_resp
                                                                        ,type_to_relations.get(RelationTyps.E, set()))
 
-        graph.relations = optimized_cond.union(optimized_resp).union(type_to_relations.get(RelationTyps.I, set())
-                                                                     ,type_to_relations.get(RelationTyps.E, set()))
+        relations = set(optimized_cond)
+        relations.update(optimized_resp, type_to_relations.get(RelationTyps.I, set()),
+                         type_to_relations.get(RelationTyps.E, set()))
+        graph.relations = relations
 
     @staticmethod
     def _optimize_object_subgraphs(ocdcr: OCDCRGraph) -> None:
@@ -96,8 +101,10 @@ class GraphOptimizations:
         optimized_resp = GraphOptimizations._filter_excluded_relations( optimized_resp
                                                                        ,type_to_relations.get(RelationTyps.E, set()))
 
-        ocdcr.sync_relations = optimized_cond.union(optimized_resp).union(type_to_relations.get(RelationTyps.I, set())
-                                                                          ,type_to_relations.get(RelationTyps.E, set()))
+        sync_relations = set(optimized_cond)
+        sync_relations.update(optimized_resp, type_to_relations.get(RelationTyps.I, set()),
+                              type_to_relations.get(RelationTyps.E, set()))
+        ocdcr.sync_relations = sync_relations
 
     @staticmethod
     def _group_relations_by_type(relations: Set[DCRRelation]) -> Dict[RelationTyps, Set[DCRRelation]]:
@@ -129,14 +136,10 @@ class GraphOptimizations:
         if not relations:
             return set()
 
+        # Build relation map and add all its edges to the graph in one call
+        relation_map = {(rel.start_event.activity, rel.target_event.activity): rel for rel in relations}
         G = nx.DiGraph()
-        relation_map = {}
-
-        # Build graph and relation map
-        for rel in relations:
-            edge = (rel.start_event.activity, rel.target_event.activity)
-            G.add_edge(*edge)
-            relation_map[edge] = rel
+        G.add_edges_from(relation_map)
 
         # Handle cycles -> should not appear usually, this is just for safety
         cycle_edges = set()
@@ -153,7 +156,8 @@ class GraphOptimizations:
 
         # Perform transitive reduction
         TR = nx.transitive_reduction(G)
-        reduced_edges = set(TR.edges()).union(cycle_edges)
+        reduced_edges = set(TR.edges())
+        reduced_edges.update(cycle_edges)
 
         return {relation_map[edge] for edge in reduced_edges if edge in relation_map}
 
@@ -198,13 +202,12 @@ class GraphOptimizations:
 
         # Iterate over all synchronization relations in the OC-DCR model
         for relation in oc_dcr.sync_relations:
-            if oc_dcr.corr(relation.start_event) == IN_TOP_GRAPH or oc_dcr.corr(relation.target_event) == IN_TOP_GRAPH:
+            start_obj = oc_dcr.corr(relation.start_event)
+            target_obj = oc_dcr.corr(relation.target_event)
+            if start_obj is IN_TOP_GRAPH or target_obj is IN_TOP_GRAPH:
                 continue
-            # Get the object types associated with the start and target events of the relation
-            correlated_obj_star = oc_dcr.corr(relation.start_event).type
-            correlated_obj_targ = oc_dcr.corr(relation.target_event).type
-            # If the two object types are not declared as derived entities, it can be removed
-            if not data.are_derived_entities(correlated_obj_star ,correlated_obj_targ):
+            # If the object types of the start and target events are not declared as derived entities, it can be removed
+            if not data.are_derived_entities(start_obj.type, target_obj.type):
                 to_filter.add(relation)
         # Remove all relations that don't connect derived entities
         oc_dcr.sync_relations.difference_update(to_filter)
@@ -263,7 +266,39 @@ class GraphOptimizations:
 
     def build_group_descendants(nestedgroups: dict) -> dict:
         """
-        Computes all descendants for each group recursively.
+        Computes all descendants for each group.
+
+        Groups are expanded bottom-up, so the descendants of a subgroup are computed once and reused by all groups
+        containing it.
+
+        Args:
+            nestedgroups (dict): Maps group → direct children, can be events or subgroups
+
+        Returns:
+            dict: group → set of all transitive descendants
+        """
+        try:
+            # children come before the groups containing them
+            order = tuple(TopologicalSorter(nestedgroups).static_order())
+        except CycleError:
+            return GraphOptimizations._build_group_descendants_by_search(nestedgroups)
+
+        descendants = {}
+        for node in order:
+            children = nestedgroups.get(node)
+            if children is None:
+                continue  # plain event
+            node_descendants = set(children)
+            for child in children:
+                node_descendants.update(descendants.get(child, _NO_CHILDREN))
+            descendants[node] = node_descendants
+
+        return {group: descendants[group] for group in nestedgroups}
+
+    def _build_group_descendants_by_search(nestedgroups: dict) -> dict:
+        """
+        Computes all descendants for each group with a separate search per group, which also terminates on cyclic
+        group definitions.
 
         Args:
             nestedgroups (dict): Maps group → direct children, can be events or subgroups
@@ -281,7 +316,7 @@ class GraphOptimizations:
                     continue
                 visited.add(current)
                 # Add direct children 
-                children = nestedgroups.get(current, set())
+                children = nestedgroups.get(current, _NO_CHILDREN)
                 stack.extend(children)
 
             visited.remove(group)  # Exclude the group itself
@@ -302,11 +337,19 @@ class GraphOptimizations:
         """
         reverse_ancestors = defaultdict(set)
 
-        for child, parent in nested_map.items():
-            current = parent
-            while current:
-                reverse_ancestors[child].add(current)
-                current = nested_map.get(current)  # next parent
+        for child in nested_map:
+            # Walk up until an element whose ancestors are already known or the top of the chain
+            chain = []
+            current = child
+            while current not in reverse_ancestors and nested_map.get(current):
+                chain.append(current)
+                current = nested_map[current]
+
+            # Assign the ancestors top-down so every element on the chain reuses its parent's set
+            known = reverse_ancestors.get(current, set())
+            for element in reversed(chain):
+                known = known | {nested_map[element]}
+                reverse_ancestors[element] = known
 
         return reverse_ancestors
 
@@ -371,12 +414,11 @@ class GraphOptimizations:
                 return True
 
         # Case 3: Group-to-group relation exists, and this is a descendant-to-descendant duplicate
-        for source_group, source_descs in group_descendants.items():
-            if source in source_descs:
-                for target_group, target_descs in group_descendants.items():
-                    if target in target_descs:
-                        if source_group in rel_dict and target_group in rel_dict[source_group]:
-                            return True
+        # Only groups with outgoing relations can imply the duplicate, so scan those instead of all group pairs
+        for source_group, group_targets in rel_dict.items():
+            if source in group_descendants.get(source_group, ()):
+                if any(target in group_descendants.get(target_group, ()) for target_group in group_targets):
+                    return True
         return False
     
     def get_relation_partition(relations: Set[DCRRelation]) -> Tuple[Set[DCRRelation], Set[DCRRelation]]:
@@ -405,6 +447,39 @@ class GraphOptimizations:
                 sync.add(rel)
         return sync, one
 
+    def rename_template_events(template: dict, rename: Dict[str, str]) -> dict:
+        """
+        Renames activities throughout a DCR graph template, including markings, relations and nested groups.
+
+        Args:
+            template (dict): The template dictionary with events, markings, relation dictionaries and nested groups.
+            rename (Dict[str, str]): Maps old activity names to new ones; activities not in the map are kept.
+
+        Returns:
+            dict: The template with all activities renamed.
+        """
+        def new_name(activity):
+            # Relation targets of object-centric relations are (activity, quantifier_head, quantifier_tail) tuples
+            if isinstance(activity, tuple):
+                return (rename.get(activity[0], activity[0]),) + activity[1:]
+            return rename.get(activity, activity)
+
+        template['events'] = {new_name(event) for event in template['events']}
+        template['marking'] = {
+            marking: {new_name(event) for event in events} for marking, events in template['marking'].items()
+        }
+        for rel_type in ('includesTo', 'excludesTo', 'responseTo', 'conditionsFor', 'nestedgroups'):
+            if rel_type in template:
+                template[rel_type] = {
+                    new_name(source): {new_name(target) for target in targets}
+                    for source, targets in template[rel_type].items()
+                }
+        if 'nestedgroupsMap' in template:
+            template['nestedgroupsMap'] = {
+                new_name(child): new_name(parent) for child, parent in template['nestedgroupsMap'].items()
+            }
+        return template
+
     @staticmethod
     def create_nestings_for_subgraphs(oc_dcr: OCDCRGraph) -> OCDCRGraph:
         """
@@ -413,8 +488,8 @@ class GraphOptimizations:
         1. Filter out all syncronizing relations to only apply nested with one to one relations
         2. Applies the nesting algorithm to derive a new nested DCR graph template.
         3. Filters out redundant relations caused by nesting from template.
-        4. Converts template to ocdcr object.
-        5. Renames group activities to include the object type (to ensure uniqueness).
+        4. Renames group activities to include the object type (to ensure uniqueness).
+        5. Converts template to ocdcr object.
         6. Preserves and reassigns relations and quantifiers from the original.
         7. Reconstructs the object in the ocdcr graph with the new nested DCR.
         
@@ -434,12 +509,12 @@ class GraphOptimizations:
             # get the template after applying nested and filter out redundant relations
             new_dcr_template = GraphOptimizations.filter_template_relations(GraphOptimizations.apply_nested(dcr_obj.to_dcr()))
 
+            # Give unique group names by appending the object ID, before any events are created from the template
+            group_names = {group: f"{group}_{obj_id}" for group in new_dcr_template.get("nestedgroups", {})}
+            new_dcr_template = GraphOptimizations.rename_template_events(new_dcr_template, group_names)
+
             #  Create a new OCDCRObject using the nested DCR structure
             new_obj = OCDCRObject(dcr_obj.spawn, dcr_obj.type, new_dcr_template)
-            
-            # Give unique group names by appending the object ID
-            for group in new_obj.nested_events:
-                group.activity = f"{group.activity}_{obj_id}"
 
             # Add relations from the existing graph if still in nested to preserve quantifiers
             for rel in list(dcr_obj.relations):  # Copy to avoid modifying while iterating
@@ -25,7 +25,7 @@ def export_dcr_xml(graph:DCRGraph, output_file_name, dcr_title='DCR graph from o
 
         Parameters:
             graph (DCRGraph): The graph to export, which will be deep-copied to avoid side effects
-            output_file_name (str): Path to the XML file to be written
+            output_file_name (str): Path to the XML file to be written, or a binary file object
             dcr_title (str, optional): Title attribute for the DCR graph. Defaults to 'DCR graph from ocpa'
     """
     graph = deepcopy(graph)
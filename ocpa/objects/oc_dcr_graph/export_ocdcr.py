@@ -27,7 +27,7 @@ def export_ocdcr_xml(graph:OCDCRGraph, output_file_name, dcr_title='OCDCR graph
 
         Parameters:
             graph (OCDCRGraph): The object-centric DCR graph to export
-            output_file_name (str): Path to the XML file to be written
+            output_file_name (str): Path to the XML file to be written, or a binary file object
             dcr_title (str, optional): Title to assign to the XML root element
     """
 
@@ -128,13 +128,18 @@ def export_ocdcr_xml(graph:OCDCRGraph, output_file_name, dcr_title='OCDCR graph
         xml_rule.set("targetId", a2)
 
 
-    for event in graph.marking.get_set(MarkingTyps.E).union(sub_marking_e):
+    # merge the top level marking into the collected object markings
+    sub_marking_e.update(graph.marking.get_set(MarkingTyps.E))
+    sub_marking_i.update(graph.marking.get_set(MarkingTyps.I))
+    sub_marking_p.update(graph.marking.get_set(MarkingTyps.P))
+
+    for event in sub_marking_e:
         marking_exec = etree.SubElement(executed, "event")
         marking_exec.set("id", event.activity)
-    for event in graph.marking.get_set(MarkingTyps.I).union(sub_marking_i):
+    for event in sub_marking_i:
         marking_incl = etree.SubElement(included, "event")
         marking_incl.set("id", event.activity)
-    for event in graph.marking.get_set(MarkingTyps.P).union(sub_marking_p):
+    for event in sub_marking_p:
         marking_pend = etree.SubElement(pendingResponse, "event")
         marking_pend.set("id", event.activity)
 
@@ -3,6 +3,33 @@ from copy import deepcopy
 from ocpa.objects.oc_dcr_graph import DCRGraph, OCDCRGraph, RelationTyps, OCDCRObject
 
 
+def _filtered_copy(dcr: DCRGraph | OCDCRGraph | OCDCRObject, keep, keep_sync=None):
+    """
+        Deep copies the graph once and filters the relations of the copy in a single pass per container.
+
+        The objects of an OCDCRGraph are part of the copy already, so their relations are filtered in place
+        instead of deep copying every object a second time.
+
+        Parameters:
+            dcr (DCRGraph | OCDCRGraph | OCDCRObject): The graph or object whose relations are to be filtered
+            keep: Predicate deciding whether a relation of the top level graph or of an object is retained
+            keep_sync: Predicate deciding whether a sync relation is retained (Default: keep)
+
+        Returns:
+            A deep-copied version of the input graph or object with only the retained relations
+    """
+    g = deepcopy(dcr)
+    g.relations = {r for r in g.relations if keep(r)}
+
+    if isinstance(g, OCDCRGraph):
+        for o in g.objects.values():
+            o.relations = {r for r in o.relations if keep(r)}
+        keep_sync = keep if keep_sync is None else keep_sync
+        g.sync_relations = {r for r in g.sync_relations if keep_sync(r)}
+
+    return g
+
+
 def filter_by_relation_type(dcr: DCRGraph | OCDCRGraph | OCDCRObject, constraint_types: set[RelationTyps]):
     """
         Filters the relations in a DCR-like graph structure based on the specified constraint types.
@@ -18,15 +45,7 @@ def filter_by_relation_type(dcr: DCRGraph | OCDCRGraph | OCDCRObject, constraint
         Returns:
             A deep-copied version of the input graph or object with only the specified types of relations retained
     """
-    g = deepcopy(dcr)
-    g.relations = {r for r in g.relations if r.type in constraint_types}
-
-    if isinstance(dcr, OCDCRGraph):
-        for k, o in g.objects.items():
-            g.objects[k] = filter_by_relation_type(o, constraint_types)
-        g.sync_relations = {r for r in g.sync_relations if r.type in constraint_types}
-
-    return g
+    return _filtered_copy(dcr, lambda r: r.type in constraint_types)
 
 
 def filter_many_to_many(dcr: DCRGraph | OCDCRGraph | OCDCRObject, constraint_types = set()):
@@ -45,25 +64,14 @@ def filter_many_to_many(dcr: DCRGraph | OCDCRGraph | OCDCRObject, constraint_typ
         Returns:
             A deep-copied version of the input with filtered relations based on the specified rules.
     """
-    g = deepcopy(dcr)
-
-
-    g.relations = {
-        r for r in g.relations if (
-                    (r.type in constraint_types)
-                    or (hasattr(r, "quantifier_head") is False)
-                    or (hasattr(r, "quantifier_head") and
-                        ((r.quantifier_head and r.quantifier_tail)
+    def keep(r):
+        return ((r.type in constraint_types)
+                or (hasattr(r, "quantifier_head") is False)
+                or (hasattr(r, "quantifier_head") and
+                    ((r.quantifier_head and r.quantifier_tail)
                      is False)))
-    }
-
-    if isinstance(dcr, OCDCRGraph):
 
-        g.sync_relations = {r for r in g.sync_relations if r.type in constraint_types}
-        for k, o in g.objects.items():
-            g.objects[k] = filter_many_to_many(o, constraint_types)
-
-    return g
+    return _filtered_copy(dcr, keep, lambda r: r.type in constraint_types)
 
 def filter_one_to_many(dcr: DCRGraph | OCDCRGraph | OCDCRObject, constraint_types: set[RelationTyps] = set()):
     """
@@ -80,28 +88,11 @@ def filter_one_to_many(dcr: DCRGraph | OCDCRGraph | OCDCRObject, constraint_type
         Returns:
             A deep-copied version of the input graph or object with one-to-many relations filtered out.
     """
-    g = deepcopy(dcr)
-
-    g.relations = {
-        r for r in g.relations if (
-                (r.type in constraint_types)
+    def keep(r):
+        return ((r.type in constraint_types)
                 or (hasattr(r, "quantifier_head") is False)
                 or (hasattr(r, "quantifier_head") and
                     ((r.quantifier_head or r.quantifier_tail)
                      is False) and ((r.quantifier_head and r.quantifier_tail) is False)))
-    }
-
-    if isinstance(dcr, OCDCRGraph):
-        g.sync_relations = {
-            r for r in g.sync_relations if (
-                    (r.type in constraint_types)
-                    or (hasattr(r, "quantifier_head") is False)
-                    or (hasattr(r, "quantifier_head") and
-                        ((r.quantifier_head or r.quantifier_tail)
-                         is False) and ((r.quantifier_head and r.quantifier_tail) is False)))
-        }
-        for k, o in g.objects.items():
-            g.objects[k] = filter_one_to_many(o, constraint_types)
-
-
-    return g
\ No newline at end of file
+
+    return _filtered_copy(dcr, keep)
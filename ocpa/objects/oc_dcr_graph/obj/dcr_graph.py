@@ -1,10 +1,12 @@
-from typing import Set, Dict, Optional
-import copy
+from typing import Set, Dict, Iterable, List, Optional
 
 from .markings import DCRMarking, MarkingTyps
 from .relations import DCRRelation, RelationTyps
 from .event import Event
+from .tracked_set import TrackedSet, as_tracked_set
 
+# events are included unless a marking is given
+_DEFAULT_MARKING = frozenset({MarkingTyps.I})
 
 
 class DCRGraph:
@@ -39,10 +41,20 @@ class DCRGraph:
 
 		"""
 		self.__marking = DCRMarking()
-		self.__relations: Set[DCRRelation] = set()
-		self.__events: Set[Event] = set()
+		self.__relations: Set[DCRRelation] = TrackedSet()
+		self.__events: Set[Event] = TrackedSet()
 		self.__nestedgroups: Dict[Event, Set[Event]] = {}
 		self.__nested_events: Set[Event] = set()
+		self.__event_by_activity: Dict[str, Event] = dict()  # {(activity name, Event)} Index of all events of the graph
+		self.__event_index_signature = None  # Identity and version of the event sets the index was built from
+		self.__indexed_event_sets = ()  # Keeps the indexed sets alive so that their ids stay unique
+		self.__event_index_checked = None  # TrackedSet.modifications when the event index was last found up to date
+		self.__out_relations: Dict[str, List[DCRRelation]] = dict()  # {(activity, relations)} Outgoing relations of an activity
+		self.__in_relations: Dict[str, List[DCRRelation]] = dict()  # {(activity, relations)} Incoming relations of an activity
+		self.__rel_index: Dict[tuple, DCRRelation] = dict()  # {((start, target, type), relation)} Relations by activity names and type
+		self.__relation_index_signature = None  # Identity and version of the relation sets the indexes were built from
+		self.__indexed_relation_sets = ()  # Keeps the indexed sets alive so that their ids stay unique
+		self.__relation_index_checked = None  # TrackedSet.modifications when the relation indexes were last found up to date
 
 		if template is not None:
 			from ocpa.util.dcr.converter import DCRConverter
@@ -54,16 +66,17 @@ class DCRGraph:
 				child.parent = g
 
 	@classmethod
-	def from_attributes(cls, events: Set[Event], relations: Set[DCRRelation], marking: DCRMarking,
+	def from_attributes(cls, events: Set[Event], relations: Iterable[DCRRelation], marking: DCRMarking,
 						nested_groups: Dict[Event, Set[Event]], nested_events: Set[Event]) -> 'DCRGraph':
 
 		"""
 		Create a DCRGraph by initializing it with given components.
 
+		The containers are copied, the events and relations in them are shared with the given components.
 
 		Args:
 			events: Set of Event objects to include in the graph.
-			relations: Set of DCRRelation objects defining the structure.
+			relations: DCRRelation objects defining the structure, any iterable is collected into the relation set.
 			marking: DCRMarking representing the execution state.
 			nested_groups: Dictionary mapping group events to child events.
 			nested_events: Set of Events that belong to any group.
@@ -72,13 +85,13 @@ class DCRGraph:
 			A new DCRGraph instance based on the provided components.
 		"""
 		graph = cls()
-		graph.events = copy.deepcopy(events)
-		graph.relations = copy.deepcopy(relations)
-		graph.marking = copy.deepcopy(marking)
-		graph.nestedgroups = copy.deepcopy(nested_groups)
-		graph.nested_events = copy.deepcopy(nested_events)
+		graph.events = TrackedSet(events)
+		graph.relations = TrackedSet(relations)
+		graph.marking = marking.copy()
+		graph.nestedgroups = {group: set(children) for group, children in nested_groups.items()}
+		graph.nested_events = set(nested_events)
 
-		# Ensure parent references are maintained in copied nested events
+		# Ensure parent references are maintained in nested events
 		for parent, children in graph.nestedgroups.items():
 			for child in children:
 				child.parent = parent
@@ -116,7 +129,9 @@ class DCRGraph:
 
 	@relations.setter
 	def relations(self, relations):
-		self.__relations = relations
+		# plain sets are copied into a tracked set, so that the relation indexes notice later changes
+		self.__relations = as_tracked_set(relations)
+		TrackedSet.count_modification()
 
 	@property
 	def events(self) -> Set['Event']:
@@ -124,7 +139,48 @@ class DCRGraph:
 
 	@events.setter
 	def events(self, events):
-		self.__events = events
+		# plain sets are copied into a tracked set, so that the event index notices later changes
+		self.__events = as_tracked_set(events)
+		TrackedSet.count_modification()
+
+	def _event_sets(self) -> tuple:
+		"""All containers holding events of the graph."""
+		return (self.events,)
+
+	def _event_sets_signature(self) -> tuple:
+		"""Identity and version of the event sets, used to detect outside modifications."""
+		return tuple((id(events), events.version) for events in self._event_sets())
+
+	def _get_event_index(self) -> Dict[str, Event]:
+		"""
+		Return the activity name to event index, rebuilding it if the event sets were changed outside the graph API.
+
+		The event sets are only compared one by one if any tracked set changed since the last check.
+
+		Returns:
+			Dictionary mapping activity names to the events of the graph
+		"""
+		modifications = TrackedSet.modifications
+		if modifications != self.__event_index_checked:
+			if self._event_sets_signature() != self.__event_index_signature:
+				index = dict()
+				for events in self._event_sets():
+					index.update((event.activity, event) for event in events)
+				self.__event_by_activity = index
+				self._mark_events_indexed()
+			self.__event_index_checked = modifications
+		return self.__event_by_activity
+
+	def _mark_events_indexed(self) -> None:
+		"""Remember the current event sets as indexed."""
+		self.__event_index_signature = self._event_sets_signature()
+		self.__indexed_event_sets = self._event_sets()
+		self.__event_index_checked = TrackedSet.modifications
+
+	def _index_event(self, event: Event) -> None:
+		"""Add an event added through the graph API to the activity index, which must be up to date before."""
+		self.__event_by_activity[event.activity] = event
+		self._mark_events_indexed()
 
 	def get_event(self, activity: str) -> Optional[Event]:
 		"""
@@ -136,22 +192,87 @@ class DCRGraph:
 		Returns:
 			The Event object if found, None otherwise
 		"""
-		for event in self.events:
-			if event.activity == activity:
-				return event
-		return None
+		return self._get_event_index().get(activity)
 
-	def add_relation(self, start_event: str | Event, target_event: str | Event,
-					 relation_type: RelationTyps) -> None:
+	def _relation_sets(self) -> tuple:
+		"""All containers holding relations of the graph."""
+		return (self.relations,)
+
+	def _get_relation_index(self) -> tuple:
 		"""
-		Add a relation between two events. If the relation already exists, nothing happens.
+		Return the outgoing and incoming adjacency index, rebuilding it together with the relation key index if the
+		relation sets were changed outside the graph API.
+
+		The relation sets are only compared one by one if any tracked set changed since the last check.
+
+		Returns:
+			Tuple of dictionaries mapping activity names to their outgoing and incoming relations
+		"""
+		modifications = TrackedSet.modifications
+		if modifications != self.__relation_index_checked:
+			relation_sets = self._relation_sets()
+			signature = tuple((id(relations), relations.version) for relations in relation_sets)
+			if signature != self.__relation_index_signature:
+				self.__out_relations = dict()
+				self.__in_relations = dict()
+				self.__rel_index = dict()
+				for relations in relation_sets:
+					for rel in relations:
+						self.__out_relations.setdefault(rel.start_event.activity, []).append(rel)
+						self.__in_relations.setdefault(rel.target_event.activity, []).append(rel)
+						self.__rel_index.setdefault((rel.start_event.activity, rel.target_event.activity, rel.type), rel)
+				self._mark_relations_indexed()
+			self.__relation_index_checked = modifications
+		return self.__out_relations, self.__in_relations
+
+	def _mark_relations_indexed(self) -> None:
+		"""Remember the current relation sets as indexed."""
+		relation_sets = self._relation_sets()
+		self.__relation_index_signature = tuple((id(relations), relations.version) for relations in relation_sets)
+		self.__indexed_relation_sets = relation_sets
+		self.__relation_index_checked = TrackedSet.modifications
+
+	def _index_relation(self, relation: DCRRelation) -> None:
+		"""Add a relation added through the graph API to the indexes, which must be up to date before."""
+		self.__out_relations.setdefault(relation.start_event.activity, []).append(relation)
+		self.__in_relations.setdefault(relation.target_event.activity, []).append(relation)
+		self.__rel_index.setdefault((relation.start_event.activity, relation.target_event.activity, relation.type),
+									relation)
+		self._mark_relations_indexed()
+
+	def _unindex_relation(self, relation: DCRRelation) -> None:
+		"""Remove a relation removed through the graph API from the indexes, which must be up to date before."""
+		for index, activity in ((self.__out_relations, relation.start_event.activity),
+								(self.__in_relations, relation.target_event.activity)):
+			rels = index.get(activity, [])
+			for i, rel in enumerate(rels):
+				# relations are removed by value, the given relation may be an equal copy of the indexed one
+				if rel == relation:
+					del rels[i]
+					break
+		key = (relation.start_event.activity, relation.target_event.activity, relation.type)
+		if self.__rel_index.get(key) == relation:
+			del self.__rel_index[key]
+			# another relation with the same endpoints and type may still exist, e.g. with other quantifiers
+			for rel in self.__out_relations.get(key[0], ()):
+				if rel.target_event.activity == key[1] and rel.type is key[2]:
+					self.__rel_index[key] = rel
+					break
+		self._mark_relations_indexed()
+
+	def _resolve_relation_events(self, start_event: str | Event, target_event: str | Event) -> tuple:
+		"""
+		Resolve the events of a relation given either as activity names or as events.
 
 		Args:
 			start_event: The source event or its activity name
 			target_event: The target event or its activity name
-			type: The type of relation to add
+
+		Returns:
+			Tuple of the source and target Event
 
 		Raises:
+			ValueError: If an activity name is not found
 			TypeError: If the event arguments are of invalid types
 		"""
 		# Convert string activity names to Event objects if strings
@@ -164,16 +285,34 @@ class DCRGraph:
 
 		if not (isinstance(start_event, Event) and isinstance(target_event, Event)):
 			raise TypeError("Events must be both strings or both Event objects")
+		return start_event, target_event
+
+	def add_relation(self, start_event: str | Event, target_event: str | Event,
+					 relation_type: RelationTyps) -> None:
+		"""
+		Add a relation between two events. If the relation already exists, nothing happens.
+
+		Args:
+			start_event: The source event or its activity name
+			target_event: The target event or its activity name
+			relation_type: The type of relation to add
+
+		Raises:
+			TypeError: If the event arguments are of invalid types
+		"""
+		start_event, target_event = self._resolve_relation_events(start_event, target_event)
 		# Check if relation already exists
 		e = self.get_relation(start_event, target_event, relation_type)
 		if e is None:
-			self.__relations.add(DCRRelation(start_event,target_event,relation_type))
-    
-	def get_relation(self, start_event: Event, target_event: Event, type: RelationTyps) -> DCRRelation | None:
+			relation = DCRRelation(start_event, target_event, relation_type)
+			self.relations.add(relation)
+			self._index_relation(relation)
+
+	def get_relation(self, start_event: Event, target_event: Event, relation_type: RelationTyps) -> DCRRelation | None:
 		"""
-		Return a specific edge between two events in the DCR graph.
+		Return a specific edge between two events in the graph.
 
-		Searches through:
+		Searches through all relation sets of the graph, for OCDCR graphs these are:
 		1. Main graph relations
 		2. Relations within each object's subgraph
 		3. Synchronization relations between objects
@@ -181,25 +320,14 @@ class DCRGraph:
 		Args:
 			start_event: The source event of the relation
 			target_event: The target event of the relation
-			type: The type of relation to search for
+			relation_type: The type of relation to search for
 
 		Returns:
 			DCRRelation: The matching relation object or None if not found.
 
 		"""
-
-		def matches(r: DCRRelation) -> bool:
-			return (
-					r.type == type and
-					r.start_event.activity == start_event.activity and
-					r.target_event.activity == target_event.activity
-			)
-
-		for r in self.relations:
-			if matches(r):
-				return r
-
-		return None
+		self._get_relation_index()
+		return self.__rel_index.get((start_event.activity, target_event.activity, relation_type))
 			
 	def remove_relation(self, relation: DCRRelation) -> bool:
 		"""
@@ -215,24 +343,28 @@ class DCRGraph:
 		# Validate relation exists
 		if relation not in self.relations:
 			return False
-
+		self._get_relation_index()
 		self.relations.discard(relation)
+
+		self._unindex_relation(relation)
 		return True
 
-	def add_event(self, activity: str | Event, marking: Set[MarkingTyps] = {MarkingTyps.I},
+	def add_event(self, activity: str | Event, marking: Optional[Set[MarkingTyps]] = None,
 				  isGroup: bool = False, parent: str = None) -> Event:
 		"""
 		Add a new event to the graph.
 
 		Args:
 			activity: The name of the event or the event
-			marking: The initial marking of the event as set, empty set if event is neither executed, pending nor included (default: {Included})
+			marking: The initial marking of the event as set, empty set if event is neither executed, pending nor included (default: None ## event is included)
 			isGroup: Whether this is a group event (default: False)
 			parent: Optional parent if event is part of a group
 
 		Returns:
 			The newly created or added Event object
 		"""
+		if marking is None:
+			marking = _DEFAULT_MARKING
 		if isinstance(activity, str):
 			# Create new event with given name and group status
 			new_event = Event(activity, isGroup)
@@ -256,7 +388,9 @@ class DCRGraph:
 			new_event.parent.isGroup = True
 			self.nestedgroups.setdefault(new_event.parent, set()).add(new_event)
 
+		self._get_event_index()
 		self.events.add(new_event)
+		self._index_event(new_event)
 		for mark in marking:
 			self.marking.add_event(new_event, mark)
 		return new_event
@@ -285,6 +419,8 @@ class DCRGraph:
 			raise TypeError("parent must be either str or Event")
 
 		parent.isGroup = True
+		# Initialize parent's child set if it doesn't exist, it is looked up once for all children
+		group_children = self.nestedgroups.setdefault(parent, set())
 		# Process each child in the set
 		for child in children:
 			if isinstance(child, str):
@@ -293,10 +429,7 @@ class DCRGraph:
 			elif not isinstance(child, Event):
 				raise TypeError("child must be either str or Event")
 			child.parent = parent
-			# Initialize parent's child set if it doesn't exist
-			if parent not in self.nestedgroups:
-				self.nestedgroups[parent] = set()
-			self.nestedgroups[parent].add(child)
+			group_children.add(child)
 
 	def get_incidental_relations(self, event: Event) -> Set[DCRRelation]:
 		"""
@@ -311,16 +444,15 @@ class DCRGraph:
 		if self.get_event(event.activity) is None:
 			return set()
 
-		rel_set = set()
-		for rel in self.relations:
-			if rel.start_event == event or rel.target_event == event:
-				rel_set.add(rel)
-		return rel_set
+		out_relations, in_relations = self._get_relation_index()
+		incidental_relations = set(out_relations.get(event.activity, ()))
+		incidental_relations.update(in_relations.get(event.activity, ()))
+		return incidental_relations
 
 	def _remove_incidental_relations(self, event: Event) -> None:
-		"""Remove all relations connected to a specific event."""
+		"""Remove all relations connected to a specific event, keeping the relation indexes up to date."""
 		for rel in self.get_incidental_relations(event):
-			self.relations.remove(rel)
+			self.remove_relation(rel)
 
 	def remove_event(self, event: Event) -> None:
 		"""
@@ -330,7 +462,10 @@ class DCRGraph:
 			event: The event to remove
 		"""
 		self._remove_incidental_relations(event)
+		event_index = self._get_event_index()
 		self.events.remove(event)
+		event_index.pop(event.activity, None)
+		self._mark_events_indexed()
 		self.marking.remove_event(event)
 
 		if event.parent is not None:
@@ -1,11 +1,17 @@
+import sys
 from typing import Optional
 from dataclasses import dataclass
 
-@dataclass(unsafe_hash=True)
+@dataclass(slots=True)
 class Event:
 	"""
 	Represents an event in a DCR graph.
 
+	Events are hashed by their interned activity name only. Activity names are unique within a graph, and
+	isGroup and parent are updated while the event is already stored in sets and dicts.
+	The activity must not be changed while the event is stored in a graph: its hash, the relation hashes and
+	the graph indexes are all keyed by the activity name. Rename events before adding them to a graph.
+
 	Attributes:
 		activity: The activity name of the event
 		isGroup: Whether this event is a group and contains other events
@@ -15,4 +21,11 @@ class Event:
 	isGroup: bool = False
 	parent: Optional['Event'] = None
 
+	def __post_init__(self):
+		# Intern the activity name so that equal activities share one string object
+		if isinstance(self.activity, str):
+			self.activity = sys.intern(self.activity)
+
+	def __hash__(self):
+		return hash(self.activity)
 
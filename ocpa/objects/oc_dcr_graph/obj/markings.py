@@ -16,10 +16,14 @@ class MarkingTyps(Enum):
 	I = 'included'
 	P = 'pending'
 
+# marking type -> name of the DCRMarking attribute holding its events
+_MARKING_ATTRIBUTES = {marking: marking.value for marking in MarkingTyps}
+
 class DCRMarking:
 	"""
 	Represents the marking (state) of a DCR graph
 	"""
+	__slots__ = ('__executed', '__pending', '__included')
 
 	def __init__(self) -> None:
 		"""Initialize empty sets for executed, pending, and included events."""
@@ -27,6 +31,19 @@ class DCRMarking:
 		self.pending: Set[Event] = set()
 		self.included: Set[Event] = set()
 
+	def copy(self) -> 'DCRMarking':
+		"""
+		Create a marking with copies of the marking sets, sharing their events.
+
+		Returns:
+			The new DCRMarking
+		"""
+		marking = DCRMarking()
+		marking.executed = set(self.__executed)
+		marking.pending = set(self.__pending)
+		marking.included = set(self.__included)
+		return marking
+
 	def get_set(self, marking: MarkingTyps) -> Set[Event]:
 		"""
 		Get the set of events for a specific marking type.
@@ -37,11 +54,7 @@ class DCRMarking:
 		Returns:
 			The set of events with the specified marking
 		"""
-		return {
-			MarkingTyps.E: self.executed,
-			MarkingTyps.P: self.pending,
-			MarkingTyps.I: self.included
-		}[marking]
+		return getattr(self, _MARKING_ATTRIBUTES[marking])
 
 	def add_event(self, event: Event, marking: MarkingTyps) -> None:
 		"""
@@ -63,16 +76,19 @@ class DCRMarking:
 		Returns:
 			The marking types of the event or empty set if not found
 		"""
-		mark = set()
-		for marking in MarkingTyps:
-			if event in self.get_set(marking):
-				mark.add(marking)
-		return mark
+		event_marking = set()
+		if event in self.__executed:
+			event_marking.add(MarkingTyps.E)
+		if event in self.__included:
+			event_marking.add(MarkingTyps.I)
+		if event in self.__pending:
+			event_marking.add(MarkingTyps.P)
+		return event_marking
 
 	def remove_event(self, event: Event) -> None:
-		for marking in MarkingTyps:
-			if event in self.get_set(marking):
-				self.get_set(marking).remove(event)
+		self.__executed.discard(event)
+		self.__included.discard(event)
+		self.__pending.discard(event)
 
 	# Property getters and setters
 	@property
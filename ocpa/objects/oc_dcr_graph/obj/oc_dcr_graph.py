@@ -3,6 +3,7 @@ from .markings import MarkingTyps
 from .relations import DCRRelation, RelationTyps, OCDCRRelation
 from .event import Event
 from .oc_dcr_object import OCDCRObject
+from .tracked_set import TrackedSet, as_tracked_set
 
 from .constants import IN_TOP_GRAPH
 
@@ -45,12 +46,17 @@ class OCDCRGraph(DCRGraph):
 		self.__objects: Dict[
 			str, OCDCRObject] = dict()  # {(objectID, OCDCRObject)}  Maps object types to their OCDCRObject
 		self.__spawn_relations: Dict[Event, str] = dict()  # {(activity, objectID)}  Maps spawn events to object types
-		self.__sync_relations: Set[OCDCRRelation] = set()  # Relations between different objects
+		self.__spawned_types: Set[str] = set()  # Object types with a spawn event, the values of spawn_relations
+		self.__sync_relations: Set[OCDCRRelation] = TrackedSet()  # Relations between different objects
 		self.__activityToObject: Dict[
 			Event, str] = dict()  # {(activity, objectID)} Maps events to their object types, IN_TOP_GRAPH if in top graph
+		self.__activity_sets: Dict[str, tuple] = dict()  # {(objectID, (events, version))} Object event sets already in activityToObject
+		self.__all_relations: Optional[frozenset] = None  # Cached union of all relation sets, None if outdated
+		self.__all_events: Optional[frozenset] = None  # Cached set of all events, None if outdated
 
 		if isinstance(dcr, DCRGraph):
 			# Initialize from existing DCRGraph
+			super().__init__()
 			self.marking = dcr.marking
 			self.relations = dcr.relations
 			self.events = dcr.events
@@ -68,7 +74,9 @@ class OCDCRGraph(DCRGraph):
 
 	@sync_relations.setter
 	def sync_relations(self, sync_relations: Set[OCDCRRelation]):
-		self.__sync_relations = sync_relations
+		# plain sets are copied into a tracked set, so that the relation indexes notice later changes
+		self.__sync_relations = as_tracked_set(sync_relations)
+		TrackedSet.count_modification()
 
 	@property
 	def objects(self) -> Dict[str, OCDCRObject]:
@@ -77,6 +85,7 @@ class OCDCRGraph(DCRGraph):
 	@objects.setter
 	def objects(self, objects: Dict[str, OCDCRObject]):
 		self.__objects = objects
+		TrackedSet.count_modification()
 
 	@property
 	def spawn_relations(self) -> Dict[Event, str]:
@@ -84,9 +93,40 @@ class OCDCRGraph(DCRGraph):
 
 	@property
 	def activityToObject(self) -> Dict[Event, str]:
-		self.update_activities()
+		# only rescan objects whose event set changed outside the graph API, e.g. through the object itself
+		for key, obj in self.__objects.items():
+			indexed = self.__activity_sets.get(key)
+			if indexed is None or indexed[0] is not obj.events or indexed[1] != obj.events.version:
+				self._update_object_activities(key, obj)
 		return self.__activityToObject
 
+	def activities_view(self):
+		"""
+		Return a read-only view of all mapped events, without copying the mapping.
+
+		Returns:
+			Dict keys view of the events in the activityToObject mapping
+		"""
+		return self.activityToObject.keys()
+
+	def _event_sets(self) -> tuple:
+		"""All containers holding events of the graph: top level and object events."""
+		return (self.events, *(obj.events for obj in self.__objects.values()))
+
+	def _mark_events_indexed(self) -> None:
+		"""Remember the current event sets as indexed and drop the cached set of all events."""
+		super()._mark_events_indexed()
+		self.__all_events = None
+
+	def _relation_sets(self) -> tuple:
+		"""All containers holding relations of the graph: top level, sync and object relations."""
+		return (self.relations, self.sync_relations, *(obj.relations for obj in self.__objects.values()))
+
+	def _mark_relations_indexed(self) -> None:
+		"""Remember the current relation sets as indexed and drop the cached union of all relations."""
+		super()._mark_relations_indexed()
+		self.__all_relations = None
+
 	def add_object(self, obj: OCDCRObject) -> None:
 		"""
 		Add an object to the graph.
@@ -95,32 +135,34 @@ class OCDCRGraph(DCRGraph):
 			obj: The OCDCR object to add
 		"""
 		self.__objects[obj.type] = obj
+		# the graph now has other event and relation sets
+		TrackedSet.count_modification()
 
 		if obj.spawn is not None:
 			self.spawn_relations[obj.spawn] = obj.type
+			self.__spawned_types.add(obj.type)
 			if self.get_event(obj.spawn.activity) is None:
 				self.add_event(obj.spawn.activity)
 
-		for act in obj.events:
-			self.__activityToObject[act] = obj.type
+		self._update_object_activities(obj.type, obj)
 
-	def _add_event_to_top_level(self, activity: str | Event, marking: Set[MarkingTyps] = {MarkingTyps.I},
+	def _add_event_to_top_level(self, activity: str | Event, marking: Optional[Set[MarkingTyps]] = None,
 								isGroup: bool = False, parent: str = None) -> Event:
 		"""
 		Internal method to add an event to the top-level graph.
 
 		Args:
 			activity: The event or activity name to add
-			marking: Initial marking for the event (Default: False)
-			isGroup: Whether this is a group event (Default: {MarkingTyps.I} ## event is included)
+			marking: Initial marking for the event (Default: None ## event is included)
+			isGroup: Whether this is a group event (Default: False)
 			parent: Optional parent for nested events (Default: None)
 
 		Returns:
 			The created or added Event
 		"""
 		event = super().add_event(activity, marking=marking, isGroup=isGroup, parent=parent)
-		if event not in self.activityToObject.keys():
-			self.activityToObject[event] = IN_TOP_GRAPH
+		if event not in self.activities_view():
+			self.__activityToObject[event] = IN_TOP_GRAPH
 		return event
 
 	def _add_sync_relation(self, start_event: str, target_event: str,
@@ -140,52 +182,23 @@ class OCDCRGraph(DCRGraph):
 			start_event=self.get_event(start_event),
 			target_event=self.get_event(target_event),
 			type=relation_type,
-			quantifier_head=quantifier_head,
-			quantifier_tail=quantifier_tail,
+			quantifier_head=bool(quantifier_head),
+			quantifier_tail=bool(quantifier_tail),
 		)
-		self.__sync_relations.add(relation)
-
-	def get_relation(self, start_event: Event, target_event: Event, type: RelationTyps) -> DCRRelation | None:
-		"""
-		Return a specific edge between two events in the OCDCR graph.
-
-		Searches through:
-		1. Main graph relations
-		2. Relations within each object's subgraph
-		3. Synchronization relations between objects
-
-		Args:
-			start_event: The source event of the relation
-			target_event: The target event of the relation
-			type: The type of relation to search for
+		self._get_relation_index()
+		if relation not in self.__sync_relations:
+			self.__sync_relations.add(relation)
+			self._index_relation(relation)
 
-		Returns:
-			DCRRelation: The matching relation object or None if not found.
-
-		"""
-
-		def matches(r: DCRRelation) -> bool:
-			return (
-					r.type == type and
-					r.start_event.activity == start_event.activity and
-					r.target_event.activity == target_event.activity
-			)
-        # look in all relations
-		for r in self.get_all_relations():
-			if matches(r):
-				return r
-
-		return None
-
-	def add_event(self, activity: str | Event, marking: set[MarkingTyps] = {MarkingTyps.I},
+	def add_event(self, activity: str | Event, marking: Optional[Set[MarkingTyps]] = None,
 				  isGroup: bool = False, parent: str = None, obj: OCDCRObject | str = None) -> Event:
 		"""
 		Add an event to the graph, either to a specific object or the top level.
 
 		Args:
 			activity: The event or activity name to add
-			marking: Initial marking for the event (Default: False)
-			isGroup: Whether this is a group event (Default: {MarkingTyps.I} ## event is included)
+			marking: Initial marking for the event (Default: None ## event is included)
+			isGroup: Whether this is a group event (Default: False)
 			parent: Optional parent for nested events (Default: None)
 			obj: Optional object or object type to add the event to (Default: None)
 
@@ -206,11 +219,21 @@ class OCDCRGraph(DCRGraph):
 		if obj is None:
 			event = self._add_event_to_top_level(activity, marking=marking, isGroup=isGroup, parent=parent)
 		else:
-			if obj not in self.objects.keys():
+			object_graph = self.objects.get(obj)
+			if object_graph is None:
 				raise KeyError(f"{obj}'is not in this OC-DCR Graph ")
 			else:
-				event = self.objects[obj].add_event(activity, marking=marking, isGroup=isGroup, parent=parent)
-				self.activityToObject[event] = obj
+				# map earlier changes first, afterwards only the new events have to be added
+				activity_to_object = self.activityToObject
+				event = object_graph.add_event(activity, marking=marking, isGroup=isGroup, parent=parent)
+				# a new parent group is added to the object together with the event
+				new_event = event
+				while new_event is not None and new_event in object_graph.events:
+					activity_to_object[new_event] = obj
+					self._index_event(new_event)
+					new_event = new_event.parent
+				self.__activity_sets[obj] = (object_graph.events, object_graph.events.version)
+		self._index_event(event)
 		return event
 
 	def add_relation(self, start_event: Event, target_event: Event, relation_type: RelationTyps,
@@ -236,39 +259,37 @@ class OCDCRGraph(DCRGraph):
 			TypeError: If events are not both strings or both Event objects
 			ValueError: If either event is not found
 		"""
-		# Convert string activity names to Event objects if strings
-		if isinstance(start_event, str) and isinstance(target_event, str):
-			start_event = self.get_event(start_event)
-			target_event = self.get_event(target_event)
-
-		if start_event is None or target_event is None:
-			raise ValueError("Event not found")
-
-		if not (isinstance(start_event, Event) and isinstance(target_event, Event)):
-			raise TypeError("Events must be both strings or both Event objects")
+		start_event, target_event = self._resolve_relation_events(start_event, target_event)
+		# quantifiers given as None are not set
+		quantifier_head = bool(quantifier_head)
+		quantifier_tail = bool(quantifier_tail)
 
 		# Check if relation already exists
 		e = self.get_relation(start_event, target_event, relation_type)
-		if e is not None:
+		if isinstance(e, OCDCRRelation):
 			# Update quantifiers if relation exists
 			e.quantifier_head = quantifier_head
 			e.quantifier_tail = quantifier_tail
 			return
+		if e is not None:
+			# Plain DCR relations have no quantifiers, replace it by a quantified relation
+			self.remove_relation(e)
 
-		# Updates the activities in case some activities changed
-		self.update_activities()
 		# Decide if edge is a sync relation or normal edge and if it is in top or subgraph
-		obj_start = self.activityToObject[start_event]
-		obj_target = self.activityToObject[target_event]
+		activity_to_object = self.activityToObject
+		obj_start = activity_to_object[start_event]
+		obj_target = activity_to_object[target_event]
 
-		if obj_start == IN_TOP_GRAPH and obj_target == IN_TOP_GRAPH:
+		if obj_start is IN_TOP_GRAPH and obj_target is IN_TOP_GRAPH:
 			# One or both events in main graph
-			self.relations.add(
-				OCDCRRelation(start_event, target_event, relation_type, quantifier_head, quantifier_tail))
+			relation = OCDCRRelation(start_event, target_event, relation_type, quantifier_head, quantifier_tail)
+			self.relations.add(relation)
+			self._index_relation(relation)
 		elif obj_start == obj_target:
-			# Both events are in same object
-			self.objects[obj_start].add_relation(start_event, target_event, relation_type, quantifier_head,
-												 quantifier_tail)
+			# Both events are in same object, the object returns the relation to index
+			relation = self.objects[obj_start].add_relation(start_event, target_event, relation_type,
+															quantifier_head, quantifier_tail)
+			self._index_relation(relation)
 		else:
 			# Events are in different objects
 			self._add_sync_relation(start_event.activity, target_event.activity, relation_type, quantifier_head,
@@ -289,17 +310,36 @@ class OCDCRGraph(DCRGraph):
 
 		return self.__objects[obj_type]
 
-	def get_events(self) -> Set[Event]:
-		"""Get all events in the graph, including those in objects."""
-		self.update_activities()
-		return set(self.__activityToObject.keys()).union(super().events)
+	def get_events(self) -> frozenset[Event]:
+		"""
+		Get all events in the graph, including those in objects.
 
-	def get_all_relations(self) -> Set[DCRRelation]:
-		"""Get all relations in the graph, including those in objects and sync relations.."""
-		all_relations = self.relations.union(self.sync_relations)
-		for obj in self.objects.values():
-			all_relations = all_relations.union(obj.relations)
-		return all_relations
+		The result is cached until the events of the graph change, callers that need to change it have to copy it.
+
+		Returns:
+			Frozen set of all events
+		"""
+		event_index = self._get_event_index()
+		if self.__all_events is None:
+			self.__all_events = frozenset(event_index.values())
+		return self.__all_events
+
+	def get_all_relations(self) -> frozenset[DCRRelation]:
+		"""
+		Get all relations in the graph, including those in objects and sync relations.
+
+		The result is cached until the relations of the graph change.
+
+		Returns:
+			Frozen set of all relations
+		"""
+		self._get_relation_index()
+		if self.__all_relations is None:
+			all_relations = set()
+			for relations in self._relation_sets():
+				all_relations.update(relations)
+			self.__all_relations = frozenset(all_relations)
+		return self.__all_relations
 
 	def get_event(self, event_to_search: str | Event) -> Optional[Event]:
 		"""
@@ -314,10 +354,7 @@ class OCDCRGraph(DCRGraph):
 		if isinstance(event_to_search, Event):
 			event_to_search = event_to_search.activity
 
-		for event in self.get_events():
-			if event.activity == event_to_search:
-				return event
-		return None
+		return super().get_event(event_to_search)
 
 	def get_incidental_relations(self, event: Event) -> Set[DCRRelation]:
 		"""
@@ -332,29 +369,31 @@ class OCDCRGraph(DCRGraph):
 		if self.get_event(event.activity) is None:
 			raise KeyError(f"'{event}' not in graph")
 
-		from_relations = {
-			edge for target_event in self.activityToObject
-			for type in RelationTyps
-			if (edge := self.get_relation(event, target_event, type)) is not None
-		}
-
-		to_relations = {
-			edge for start_event in self.activityToObject
-			for type in RelationTyps
-			if (edge := self.get_relation(start_event, event, type)) is not None
-		}
-
-		return from_relations | to_relations
+		out_relations, in_relations = self._get_relation_index()
+		incidental_relations = set(out_relations.get(event.activity, ()))
+		incidental_relations.update(in_relations.get(event.activity, ()))
+		return incidental_relations
 
 	def update_activities(self):
 		"""
 		Update the activityToObject mapping for all activities of all objects.
 
-		Ensures the mapping between events and their containing objects is current.
+		Ensures the mapping between events and their containing objects is current. Call it after assigning
+		objects in the objects dictionary directly, so that the event and relation indexes include them as well.
 		"""
-		for obj in self.objects.values():
-			for act in obj.events:
-				self.__activityToObject[act] = obj.type
+		TrackedSet.count_modification()
+		for key, obj in self.objects.items():
+			self._update_object_activities(key, obj)
+
+	def _update_object_activities(self, key: str, obj: OCDCRObject) -> None:
+		"""Map all events of a single object, dropping events no longer in it, and remember the mapped event set."""
+		events = obj.events
+		stale = [act for act, obj_type in self.__activityToObject.items() if obj_type == obj.type and act not in events]
+		for act in stale:
+			del self.__activityToObject[act]
+		for act in events:
+			self.__activityToObject[act] = obj.type
+		self.__activity_sets[key] = (events, events.version)
 
 	def corr(self, a1: Event) -> OCDCRObject | str:
 		"""
@@ -368,12 +407,11 @@ class OCDCRGraph(DCRGraph):
         Raises:
             KeyError if the event is not in graph
         """
-		if a1 not in self.activityToObject.keys():
+		obj_id = self.activityToObject.get(a1)
+		if obj_id is None:
 			raise KeyError(f"'{a1}' not in graph")
 
-		obj_id = self.activityToObject[a1]
-
-		if obj_id != IN_TOP_GRAPH:
+		if obj_id is not IN_TOP_GRAPH:
 			return self.get_object_graph(obj_id)
 		else:
 			return IN_TOP_GRAPH
@@ -390,7 +428,7 @@ class OCDCRGraph(DCRGraph):
         """
 		ent = self.corr(a1)
 
-		if ent == IN_TOP_GRAPH:
+		if ent is IN_TOP_GRAPH:
 			return None
 
 		return ent.spawn
@@ -405,11 +443,22 @@ class OCDCRGraph(DCRGraph):
 
 		:parameter: relations (Set[DCRRelation]): A set of DCR relations to process.
 		"""
+		# adding relations does not move events, so the mapping is resolved once for all relations
+		activity_to_object = self.activityToObject
+		# top-level events and events of unspawned objects both map to types without a spawn event
+		spawned_types = self.__spawned_types
 		for relation in relations:
-			spawn_start = self._spawn(relation.start_event)
-			spawn_target = self._spawn(relation.target_event)
+			obj_start = activity_to_object[relation.start_event]
+			obj_target = activity_to_object[relation.target_event]
+
+			if obj_start not in spawned_types or obj_target not in spawned_types:
+				continue
 
-			if not spawn_start or not spawn_target:
+			existing = self.get_relation(relation.start_event, relation.target_event, relation.type)
+			if isinstance(existing, OCDCRRelation):
+				# upgrade the quantifiers in place instead of going through add_relation
+				existing.quantifier_head = True
+				existing.quantifier_tail = True
 				continue
 
 			self.add_relation(
@@ -434,38 +483,42 @@ class OCDCRGraph(DCRGraph):
 			  KeyError: If object referenced in relation doesn't exist
 		  """
 
-		# Validate relation exists
-		if relation not in self.get_all_relations():
-			return False
-
 		# Get object mappings safely
-		start_obj = self.activityToObject.get(relation.start_event, IN_TOP_GRAPH)
-		target_obj = self.activityToObject.get(relation.target_event, IN_TOP_GRAPH)
+		activity_to_object = self.activityToObject
+		start_obj = activity_to_object.get(relation.start_event, IN_TOP_GRAPH)
+		target_obj = activity_to_object.get(relation.target_event, IN_TOP_GRAPH)
 
-		# Determine relation location and remove
-		if start_obj == IN_TOP_GRAPH and target_obj == IN_TOP_GRAPH:
+		# Determine relation location, only this container can hold the relation
+		if start_obj is IN_TOP_GRAPH and target_obj is IN_TOP_GRAPH:
 			# Top-level relation
-			self.relations.discard(relation)
+			container = self.relations
 		elif start_obj == target_obj:
 			# Object-internal relation
-			if start_obj in self.objects:
-				self.objects[start_obj].relations.discard(relation)
-			else:
+			if start_obj not in self.objects:
 				raise KeyError(f"Object {start_obj} not found in graph")
+			container = self.objects[start_obj].relations
 		else:
 			# Sync relation between objects
-			self.sync_relations.discard(relation)
+			container = self.sync_relations
+
+		# Validate relation exists
+		if relation not in container:
+			return False
+		self._get_relation_index()
+		container.discard(relation)
 
+		self._unindex_relation(relation)
 		return True
 
 	def group_top_level_events_into_unspawned_object(self, events: Set[Event], object_type: str) -> None:
 		# Validate all events are in the top-level graph
-		invalid_events = [event for event in events if self.activityToObject.get(event) != IN_TOP_GRAPH]
+		activity_to_object = self.activityToObject
+		invalid_events = [event for event in events if activity_to_object.get(event) is not IN_TOP_GRAPH]
 		if invalid_events:
 			raise KeyError(f"The following events are not in TOP_GRAPH: {invalid_events}")
 
 		# Ensure the object type is not already spawned
-		if object_type in self.spawn_relations.values():
+		if object_type in self.__spawned_types:
 			raise KeyError(f"Object type '{object_type}' is already spawned")
 
 		# Create a new unspawned object
@@ -473,15 +526,18 @@ class OCDCRGraph(DCRGraph):
 		self.add_object(new_object)
 
 		incidental_relations = set()
-
-		# Reassign each event to the new object
 		for event in events:
 			incidental_relations.update(self.get_incidental_relations(event))
+
+		# Detach the incidental relations with one pass over each relation set instead of removing them one by one
+		for relations in self._relation_sets():
+			relations.difference_update(incidental_relations)
+
+		# Reassign each event to the new object, no relations are left to be removed with it
+		for event in events:
 			self.remove_event(event)
 			self.add_event(activity=event, obj=object_type)
 
-		self.relations.difference_update(incidental_relations)
-
 		for incidental_relation in incidental_relations:
 			head, tail = incidental_relation.get_quantifiers()
 			self.add_relation(incidental_relation.start_event, incidental_relation.target_event,
@@ -504,21 +560,27 @@ class OCDCRGraph(DCRGraph):
 		if event in self.spawn_relations.keys():
 			raise ValueError(f"'{event}' you cannot remove spawn event")
 
-		if event not in self.activityToObject:
+		obj = self.activityToObject.get(event)
+		if obj is None:
 			raise KeyError(f"'{event}' is not part of the graph.")
 
-		obj = self.activityToObject[event]
+		# bring the event index up to date before the event sets change
+		event_index = self._get_event_index()
 		# event is in top level
-		if obj == IN_TOP_GRAPH:
+		if obj is IN_TOP_GRAPH:
 			super().remove_event(event)
 		# event is in subgraph
 		else:
 			incidental_relations = self.get_incidental_relations(event)
 			for relation in incidental_relations:
 				self.remove_relation(relation)
-			self.get_object_graph(obj).remove_event(event)
+			object_graph = self.get_object_graph(obj)
+			object_graph.remove_event(event)
+			self.__activity_sets[obj] = (object_graph.events, object_graph.events.version)
 
-		del self.activityToObject[event]
+		del self.__activityToObject[event]
+		event_index.pop(event.activity, None)
+		self._mark_events_indexed()
 
 	def export_as_xml(self, output_file_name, dcr_title='OCDCR graph from ocpa') -> None:
 		"""Exports the graph to xml file."""
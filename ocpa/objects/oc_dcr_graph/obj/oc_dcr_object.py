@@ -39,6 +39,7 @@ class OCDCRObject(DCRGraph):
 		self.__type = type
 		if isinstance(dcr, DCRGraph):
 			# Initialize from existing DCRGraph
+			super().__init__()
 			self.marking = dcr.marking
 			self.relations = dcr.relations
 			self.events = dcr.events
@@ -58,12 +59,12 @@ class OCDCRObject(DCRGraph):
 		return self.__type
 
 	@type.setter
-	def type(self, type: str) -> None:
-		self.__type = type
+	def type(self, obj_type: str) -> None:
+		self.__type = obj_type
 
 	def add_relation(self, start_event: str | Event, target_event: str | Event,
 					 relation_type: RelationTyps, quantifier_head: bool = False,
-					 quantifier_tail: bool = False) -> None:
+					 quantifier_tail: bool = False) -> OCDCRRelation:
 		"""
 		Add a relation with quantifiers between two events. If the relation already exists, updates its quantifiers instead of creating a new one.
 
@@ -74,33 +75,36 @@ class OCDCRObject(DCRGraph):
 			quantifier_head: Whether there is a universal quantifier to target event, always False if not spawned (default: False)
 			quantifier_tail: Whether there is a universal quantifier from start event, always False if not spawned (default: False)
 
+		Returns:
+			The added or updated relation
+
 		Raises:
 			TypeError: If events are of invalid types
 		"""
-		# Convert string activity names to Event objects if strings
-		if isinstance(start_event, str) and isinstance(target_event, str):
-			start_event = self.get_event(start_event)
-			target_event = self.get_event(target_event)
-
-		if start_event is None or target_event is None:
-			raise ValueError("Event not found")
-
-		if not (isinstance(start_event, Event) and isinstance(target_event, Event)):
-			raise TypeError("Events must be both strings or both Event objects")
+		start_event, target_event = self._resolve_relation_events(start_event, target_event)
+		# quantifiers given as None are not set
+		quantifier_head = bool(quantifier_head)
+		quantifier_tail = bool(quantifier_tail)
 		
         # Check if relation already exists
 		e = self.get_relation(start_event, target_event, relation_type)
-		if e is not None:
+		if isinstance(e, OCDCRRelation):
 			# Update quantifiers if relation exists
 			e.quantifier_head = quantifier_head
 			e.quantifier_tail = quantifier_tail
-			return
+			return e
+		if e is not None:
+			# Plain DCR relations have no quantifiers, replace it by a quantified relation
+			self.remove_relation(e)
 
 		if self.__spawn is None:
 			# No many to many if object is not spawned
-			self.relations.add(OCDCRRelation(start_event, target_event, relation_type,False, False))
+			relation = OCDCRRelation(start_event, target_event, relation_type,False, False)
 		else:	
-			self.relations.add(OCDCRRelation(start_event, target_event, relation_type,quantifier_head, quantifier_tail))
+			relation = OCDCRRelation(start_event, target_event, relation_type,quantifier_head, quantifier_tail)
+		self.relations.add(relation)
+		self._index_relation(relation)
+		return relation
 
 
 	def to_dcr(self) -> DCRGraph:
@@ -111,11 +115,11 @@ class OCDCRObject(DCRGraph):
 			A DCRGraph containing all events and relations without quantifiers
 		"""
 
-		# ensures that there are no OCDCRRelation in the set
-		dcr_relations = {
+		# ensures that there are no OCDCRRelation in the set, collected into the graph's relation set directly
+		dcr_relations = (
 			DCRRelation(rel.start_event, rel.target_event, rel.type)
 			for rel in self.relations
-		}
+		)
 		return DCRGraph.from_attributes(
 			events=self.events,
 			relations=dcr_relations,
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Tuple
+from typing import Optional, Tuple
 from dataclasses import dataclass, field
 
 from .event import Event
@@ -19,11 +19,14 @@ class RelationTyps(Enum):
 	R = 'responseTo'
 	C = 'conditionsFor'
 
-@dataclass(unsafe_hash=True)
+@dataclass(slots=True)
 class DCRRelation:
 	"""
 	Represents a relation between two events in a DCR graph.
 
+	Relations are hashed by the activity names of their events and their type, which avoids
+	calling Event.__hash__ for both events on every set operation. The hash is computed once on first use.
+
 	Attributes:
 		start_event: The source event of the relation
 		target_event: The target event of the relation
@@ -32,6 +35,14 @@ class DCRRelation:
 	start_event: Event
 	target_event: Event
 	type: RelationTyps
+	_hash: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+
+	def __hash__(self):
+		relation_hash = self._hash
+		if relation_hash is None:
+			relation_hash = hash((self.start_event.activity, self.target_event.activity, self.type))
+			self._hash = relation_hash
+		return relation_hash
 
 	def get_quantifiers(self) -> Tuple[bool, bool]:
 		"""
@@ -45,25 +56,23 @@ class DCRRelation:
 			return self.quantifier_head, self.quantifier_tail
 		return False, False
 
-@dataclass(unsafe_hash=True)
+@dataclass(slots=True)
 class OCDCRRelation(DCRRelation):
     """
     Extended DCR relation for OCDCR graphs with quantifiers.
 
+    The quantifiers are not part of the hash, as they are updated in place while the relation is stored in sets.
+
     Attributes:
         quantifier_head: Whether there is a universal quantifier to target event
         quantifier_tail: Whether there is a universal quantifier from start event
     """
 
-    quantifier_head: bool = field(default=False)
-    quantifier_tail: bool = field(default=False)
+    quantifier_head: bool = False
+    quantifier_tail: bool = False
 
-    # guarantess that every DCRRelation has a default value for quantifier
-    def __post_init__(self):
-        if not hasattr(self, 'quantifier_head') or self.quantifier_head is None:
-            self.quantifier_head = False
-        if not hasattr(self, 'quantifier_tail') or self.quantifier_tail is None:
-            self.quantifier_tail = False
+    # keep the hash of DCRRelation, dataclass would otherwise drop it because of the generated __eq__
+    __hash__ = DCRRelation.__hash__
 
     def get_quantifiers(self) -> Tuple[bool, bool]:
         """
@@ -0,0 +1,106 @@
+from typing import Iterable
+
+
+class TrackedSet(set):
+	"""
+	A set that counts its modifications.
+
+	The graphs keep their events and relations in tracked sets, so that their indexes notice every change made
+	without the graph API, also changes that keep the size of the set.
+
+	Attributes:
+		version: Number of modifications since the set was created
+		modifications: Number of modifications of all tracked sets and of the sets making up a graph, lets
+			indexes skip checking their sets one by one while nothing changed
+	"""
+	__slots__ = ('version',)
+	modifications = 0
+
+	def __init__(self, iterable: Iterable = ()):
+		super().__init__(iterable)
+		self.version = 0
+
+	@staticmethod
+	def count_modification() -> None:
+		"""Count a change that is not made on a tracked set itself, e.g. a set of a graph being replaced."""
+		TrackedSet.modifications += 1
+
+	def _modified(self) -> None:
+		self.version += 1
+		TrackedSet.modifications += 1
+
+	def add(self, element) -> None:
+		super().add(element)
+		self._modified()
+
+	def discard(self, element) -> None:
+		super().discard(element)
+		self._modified()
+
+	def remove(self, element) -> None:
+		super().remove(element)
+		self._modified()
+
+	def pop(self):
+		element = super().pop()
+		self._modified()
+		return element
+
+	def clear(self) -> None:
+		super().clear()
+		self._modified()
+
+	def update(self, *others) -> None:
+		super().update(*others)
+		self._modified()
+
+	def difference_update(self, *others) -> None:
+		super().difference_update(*others)
+		self._modified()
+
+	def intersection_update(self, *others) -> None:
+		super().intersection_update(*others)
+		self._modified()
+
+	def symmetric_difference_update(self, other) -> None:
+		super().symmetric_difference_update(other)
+		self._modified()
+
+	def __ior__(self, other):
+		if super().__ior__(other) is NotImplemented:
+			return NotImplemented
+		self._modified()
+		return self
+
+	def __iand__(self, other):
+		if super().__iand__(other) is NotImplemented:
+			return NotImplemented
+		self._modified()
+		return self
+
+	def __isub__(self, other):
+		if super().__isub__(other) is NotImplemented:
+			return NotImplemented
+		self._modified()
+		return self
+
+	def __ixor__(self, other):
+		if super().__ixor__(other) is NotImplemented:
+			return NotImplemented
+		self._modified()
+		return self
+
+
+def as_tracked_set(items: Iterable) -> TrackedSet:
+	"""
+	Return the given tracked set itself, or a tracked set with the given items.
+
+	Args:
+		items: A tracked set to share or any iterable to copy
+
+	Returns:
+		A tracked set holding the items
+	"""
+	if isinstance(items, TrackedSet):
+		return items
+	return TrackedSet(items)
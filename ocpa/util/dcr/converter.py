@@ -1,6 +1,5 @@
 import ocpa.objects.oc_dcr_graph as dcr
 from typing import Dict
-from copy import deepcopy
 
 # Templates representing the structure of DCR and OCDCR graphs.
 # These are used for graph representations as dicts.
@@ -26,60 +25,95 @@ ocdcr_template = {
     'spawnRelations': {}
 }
 
+
+def new_dcr_template() -> Dict:
+    """
+    Returns a fresh, empty DCR template with the structure of dcr_template.
+    Building the literal is much cheaper than deep copying the module level template.
+    """
+    return {
+        'events': set(),
+        'marking': {'executed': set(), 'pending': set(), 'included': set()},
+        'includesTo': {},
+        'excludesTo': {},
+        'responseTo': {},
+        'conditionsFor': {},
+        'nestedgroups': {}
+    }
+
+
+def new_ocdcr_template() -> Dict:
+    """
+    Returns a fresh, empty OCDCR template with the structure of ocdcr_template.
+    """
+    template = new_dcr_template()
+    template['objects'] = {}
+    template['spawnRelations'] = {}
+    return template
+
+
 class DCRConverter:
     """
     A utility class to handle conversion between DCRGraph objects and their dictionary-based template representations.
     """
 
     @staticmethod
-    def _get_marking(template, graph: dcr.OCDCRGraph) -> dcr.DCRMarking:
+    def _get_marking(template, graph: dcr.OCDCRGraph, event_by_activity: Dict = None) -> dcr.DCRMarking:
         """
         Converts marking template into a DCRMarking object.
+        If given, events are resolved through event_by_activity instead of searching the graph.
         """
+        get_event = event_by_activity.get if event_by_activity is not None else graph.get_event
         marking = dcr.DCRMarking()
-        # Add executed events
-        for activity in template['marking']['executed']:
-            marking.add_event(graph.get_event(activity), dcr.MarkingTyps.E)
-        # Add included events
-        for activity in template['marking']['included']:
-            marking.add_event(graph.get_event(activity), dcr.MarkingTyps.I)
-        # Add pending events
-        for activity in template['marking']['pending']:
-            marking.add_event(graph.get_event(activity), dcr.MarkingTyps.P)
+        # Add executed, included and pending events
+        for typ_name, activities in template['marking'].items():
+            events = marking.get_set(dcr.MarkingTyps(typ_name))
+            for activity in activities:
+                events.add(get_event(activity))
         return marking
 
     @staticmethod
-    def _iterate_through_relation_temp(graph: dcr.DCRGraph, relation_dict: Dict, typ: dcr.RelationTyps) -> None:
+    def _iterate_through_relation_temp(graph: dcr.DCRGraph, relation_dict: Dict, typ: dcr.RelationTyps,
+                                       event_by_activity: Dict = None) -> None:
         """
         Adds relations of a specific type to a DCR graph based on the dictionary format.
+        If given, events are resolved through event_by_activity instead of searching the graph.
         """
+        # activity names are passed on as they are if there is no lookup table
+        get_event = event_by_activity.get if event_by_activity is not None else str
+        add_relation = graph.add_relation
+        # Conditions are treated in the other direction
+        is_condition = typ is dcr.RelationTyps.C
         for target, start_events in relation_dict.items():
+            target = get_event(target)
             for start in start_events:
-                # Conditions are treated in the other direction
-                if typ == dcr.RelationTyps.C:
-                    graph.add_relation(start, target, typ)
+                start = get_event(start)
+                if is_condition:
+                    add_relation(start, target, typ)
                 else:
-                    graph.add_relation(target, start, typ)
+                    add_relation(target, start, typ)
 
     @staticmethod
     def graph_from_template(graph: dcr.DCRGraph, template):
         """
         Converts a template dictionary to it's dcr graph representation.
         """
-        # Add events
+        # Add events, remembering them by activity for the relations, markings and groups below
+        event_by_activity = {event.activity: event for event in graph.events}
         for event in template['events']:
-            graph.add_event(event, marking=set())
+            new_event = graph.add_event(event, marking=set())
+            event_by_activity[new_event.activity] = new_event
 
         # Set marking
-        graph.marking = DCRConverter._get_marking(template, graph)
+        graph.marking = DCRConverter._get_marking(template, graph, event_by_activity)
 
         # Add all relation types
         for typ in dcr.RelationTyps:
-            DCRConverter._iterate_through_relation_temp(graph, template.get(typ.value, {}), typ)
+            DCRConverter._iterate_through_relation_temp(graph, template.get(typ.value, {}), typ, event_by_activity)
 
         # Add nested group relations
         graph.nestedgroups = {
-            graph.get_event(parent_activity): {graph.get_event(child_activity) for child_activity in val}
+            event_by_activity.get(parent_activity): {event_by_activity.get(child_activity) for child_activity in val}
             for parent_activity, val in template.get('nestedgroups', {}).items()
         }
 
@@ -91,33 +125,41 @@ class DCRConverter:
         """
         Converts a DCRGraph object into a template dictionary.
         """
-        template = deepcopy(dcr_template)
+        template = new_dcr_template()
 
         # Add events
         for event in graph.events:
             template['events'].add(event.activity)
 
         # Add markings
-        for typ in dcr.MarkingTyps:
-            template['marking'][typ.value] = {e.activity for e in graph.marking.get_set(typ)}
+        marking = graph.marking
+        template['marking'] = {
+            'executed': {e.activity for e in marking.executed},
+            'pending': {e.activity for e in marking.pending},
+            'included': {e.activity for e in marking.included},
+        }
 
-        # Add relations
+        # Add relations, the target dict of each relation type is looked up once
+        relation_templates = {typ: template[typ.value] for typ in dcr.RelationTyps}
+        condition_type = dcr.RelationTyps.C
         for relation in graph.relations:
+            relation_type = relation.type
+            relation_template = relation_templates[relation_type]
             if isinstance(relation, dcr.OCDCRRelation):
                 # Handle object-centric relations with quantifiers
-                if relation.type == dcr.RelationTyps.C:
-                    template[relation.type.value].setdefault(relation.target_event.activity, set()).add(
+                if relation_type is condition_type:
+                    relation_template.setdefault(relation.target_event.activity, set()).add(
                         (relation.start_event.activity, relation.quantifier_head, relation.quantifier_tail))
                 else:
-                    template[relation.type.value].setdefault(relation.start_event.activity, set()).add(
+                    relation_template.setdefault(relation.start_event.activity, set()).add(
                         (relation.target_event.activity, relation.quantifier_head, relation.quantifier_tail))
             else:
                 # Standard DCR relations
-                if relation.type == dcr.RelationTyps.C:
-                    template[relation.type.value].setdefault(relation.target_event.activity, set()).add(
+                if relation_type is condition_type:
+                    relation_template.setdefault(relation.target_event.activity, set()).add(
                         relation.start_event.activity)
                 else:
-                    template[relation.type.value].setdefault(relation.start_event.activity, set()).add(
+                    relation_template.setdefault(relation.start_event.activity, set()).add(
                         relation.target_event.activity)
 
         # Add nested group structure
@@ -144,20 +186,19 @@ class OCDCRConverter:
     """
 
     @staticmethod
-    def deep_merge(d1, d2):
+    def _merge_template(src, dst):
         """
-        Recursively merges dictionary d1 into d2 to combining graph templates.
+        Merges the DCR template src into the template dst.
+        The schema is fixed, so each part is merged directly instead of recursing over the dictionaries.
         """
-        from collections.abc import Mapping
-        for k, v in d1.items():
-            if k in d2:
-                if isinstance(d2[k], Mapping) and isinstance(v, Mapping):
-                    OCDCRConverter.deep_merge(v, d2[k])
-                elif isinstance(d2[k], set) and isinstance(v, set):
-                    d2[k].update(v)  # union sets
-            else:
-                d2[k] = v  # add missing keys
-        return d2
+        dst['events'].update(src['events'])
+        for marking, events in src['marking'].items():
+            dst['marking'][marking].update(events)
+        for key in ('includesTo', 'excludesTo', 'responseTo', 'conditionsFor', 'nestedgroups'):
+            merged = dst[key]
+            for activity, values in src[key].items():
+                merged.setdefault(activity, set()).update(values)
+        return dst
 
     @staticmethod
     def to_string_representation(graph: dcr.OCDCRGraph):
@@ -165,11 +206,11 @@ class OCDCRConverter:
         Converts an OCDCRGraph object to a dictionary template.
         Includes object structure and spawn relations.
         """
-        template = deepcopy(ocdcr_template)
+        template = new_ocdcr_template()
 
         # Convert core DCR part
         dcr_temp = DCRConverter.to_string_representation(graph)
-        OCDCRConverter.deep_merge(dcr_temp, template)
+        OCDCRConverter._merge_template(dcr_temp, template)
 
         # Handle individual object graphs
         for key, obj in graph.objects.items():
@@ -177,7 +218,7 @@ class OCDCRConverter:
             obj_template = DCRConverter.to_string_representation(obj)
 
             template['objects'][key].update(obj_template['events'])
-            OCDCRConverter.deep_merge(obj_template, template)
+            OCDCRConverter._merge_template(obj_template, template)
 
             if obj.spawn is not None:
                 # Add spawn relations
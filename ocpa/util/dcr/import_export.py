@@ -3,20 +3,55 @@ from ocpa.objects.log.variants.graph import EventGraph
 import ocpa.objects.log.converter.versions.df_to_ocel as obj_converter
 import ocpa.objects.log.variants.util.table as table_utils
 
+import logging
 import pandas as pd
-import math
 from typing import Dict
 from ast import literal_eval
 
 import warnings
 
-warnings.filterwarnings("ignore", message="The argument 'infer_datetime_format' is deprecated")
-
 """
     This file is basically just a copy of the import functions implemented in OCPA with minor changes in order
     to avoid dependency conflicts
 """
 
+logger = logging.getLogger(__name__)
+
+# Object columns written by ocpa are lists or sets of quoted object ids, e.g. "['o1', 'o2']" or "{'o1'}"
+def _object_list_patterns(quote: str):
+    """Returns the pattern of a list or set of object ids quoted with quote and the pattern of a single id."""
+    item = quote + r"[^" + quote + r"\\]*" + quote
+    items = r"\s*(?:" + item + r"\s*(?:,\s*" + item + r"\s*)*,?\s*)?"
+    object_list = r"^\s*(?:\[" + items + r"\]|\{" + items + r"\})\s*$"
+    return object_list, quote + r"([^" + quote + r"\\]*)" + quote
+
+
+_OBJECT_LIST_PATTERNS = [_object_list_patterns("'"), _object_list_patterns('"')]
+
+
+def _parse_object_column(column: pd.Series) -> pd.Series:
+    """
+    Parses an object column of the csv into lists (or sets) of object ids.
+    Lists and sets of quoted ids are extracted with vectorized regular expressions,
+    only the remaining values (e.g. numbers or mixed quotes) are parsed with literal_eval.
+    """
+    text = column.astype('string')
+    remaining = ~(text.isna() | text.str.strip().isin(['set()', '[]', '{}']))
+    is_set = text.str.lstrip().str.startswith('{').fillna(False)
+
+    parsed = pd.Series([[] for _ in range(len(column))], index=column.index, dtype=object)
+    for object_list, quoted_object in _OBJECT_LIST_PATTERNS:
+        simple = remaining & text.str.match(object_list).fillna(False)
+        if simple.any():
+            objects = text[simple].str.findall(quoted_object)
+            objects[is_set[simple]] = objects[is_set[simple]].map(set)
+            parsed[simple] = objects
+            remaining &= ~simple
+    if remaining.any():
+        parsed[remaining] = column[remaining].map(literal_eval)
+    return parsed
+
+
 # Original function in ocpa importer for csv
 def to_df(filepath, parameters=None):
     if parameters is None:
@@ -24,32 +59,30 @@ def to_df(filepath, parameters=None):
     df = pd.read_csv(filepath, sep=parameters["sep"])
     obj_cols = parameters['obj_names']
 
-    def _eval(x):
-        if x == 'set()':
-            return []
-        elif type(x) == float and math.isnan(x):
-            return []
-        else:
-            return literal_eval(x)
-
     df_ocel = pd.DataFrame()
 
     if obj_cols:
         for c in obj_cols:
-            df_ocel[c] = df[c].apply(_eval)
+            df_ocel[c] = _parse_object_column(df[c])
 
-    df_ocel["event_id"] = [str(i) for i in range(len(df))]
+    df_ocel["event_id"] = pd.RangeIndex(len(df)).astype(str)
     df_ocel['event_activity'] = df[parameters['act_name']]
-    df_ocel['event_timestamp'] = pd.to_datetime(df[parameters['time_name']])
+    # an optional 'time_format' avoids inferring the format of every timestamp
+    time_format = parameters.get('time_format')
+    with warnings.catch_warnings():
+        # only silence the deprecation warning while parsing, without touching the global filters
+        warnings.filterwarnings("ignore", message="The argument 'infer_datetime_format' is deprecated")
+        timestamps = pd.to_datetime(df[parameters['time_name']], format=time_format)
+        if parameters.get('start_timestamp', parameters['time_name']) != parameters['time_name']:
+            start_timestamps = pd.to_datetime(df[parameters['start_timestamp']], format=time_format)
+        else:
+            # the start timestamp is the same column, reuse the parsed timestamps
+            start_timestamps = timestamps
+    df_ocel['event_timestamp'] = timestamps
 
     df_ocel.sort_values(by='event_timestamp', inplace=True)
 
-    if "start_timestamp" in parameters:
-        df_ocel['event_start_timestamp'] = pd.to_datetime(
-            df[parameters['start_timestamp']])
-    else:
-        df_ocel['event_start_timestamp'] = pd.to_datetime(
-            df[parameters['time_name']])
+    df_ocel['event_start_timestamp'] = start_timestamps
 
     for val_name in parameters['val_names']:
         df_ocel[('event_' + val_name)] = df[parameters[val_name]]
@@ -66,10 +99,10 @@ def csv_to_ocel(filepath, parameters: Dict, file_path_object_attribute_table=Non
     if file_path_object_attribute_table:
         obj_df = pd.read_csv(file_path_object_attribute_table)
     log = Table(df, parameters=parameters, object_attributes=obj_df)
-    print("Table Format Successfully Imported")
+    logger.debug("Table Format Successfully Imported")
     obj = obj_converter.apply(df)
-    print("Object Format Successfully Imported")
+    logger.debug("Object Format Successfully Imported")
     graph = EventGraph(table_utils.eog_from_log(log))
-    print("Graph Format Successfully Imported")
+    logger.debug("Graph Format Successfully Imported")
     ocel = OCEL(log, obj, graph, parameters)
     return ocel
\ No newline at end of file
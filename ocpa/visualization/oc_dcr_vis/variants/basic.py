@@ -4,32 +4,32 @@ Basic DCR graph visualizer.
 from graphviz import Digraph
 from typing import Set,Dict
 from ocpa.objects.oc_dcr_graph import DCRRelation, DCRGraph, Event
-from ocpa.visualization.oc_dcr_vis.variants.utils_viz import cluster_to_same_cluster, is_ancestor_or_self, get_edge_attrs, initialize_graph, add_events
+from ocpa.visualization.oc_dcr_vis.variants.utils_viz import cluster_to_same_cluster, is_same_hierarchy, initialize_graph, add_events, get_non_empty_groups, add_relation_edge
 
 def add_edgeDCR(relation: DCRRelation, graph: Digraph, 
-                groupRelation: Dict[Event, Set[Event]]) -> None:
+                non_empty_groups: Set[Event]) -> None:
     """
     Add a DCR relation edge to the graph.
     
     Args:
         relation: The DCR relation to visualize
         graph: The Digraph to add to
-        groupRelation: Dictionary of group memberships
+        non_empty_groups: Groups that have at least one member
     """
     source = relation.start_event
     target = relation.target_event
     
-    # Get edge attributes based on relation type
-    edge_attrs = get_edge_attrs(relation.type)
+    # Only attributes added to those of the relation type are collected
+    edge_attrs = {}
 
     # Handle edges from/to groups
-    if source.isGroup and source in groupRelation and groupRelation[source]:
+    if source.isGroup and source in non_empty_groups:
         edge_attrs["ltail"] = f"cluster_{source.activity}"  # Edge from group
 
-    if target.isGroup and target in groupRelation and groupRelation[target]:
+    if target.isGroup and target in non_empty_groups:
         edge_attrs["lhead"] = f"cluster_{target.activity}"  # Edge to group
 
-    graph.edge(source.activity, target.activity, **edge_attrs)
+    add_relation_edge(graph, source.activity, target.activity, relation.type, edge_attrs)
 
 def apply(dcr: DCRGraph, parameters: Dict = None) -> Digraph:
     """
@@ -48,19 +48,17 @@ def apply(dcr: DCRGraph, parameters: Dict = None) -> Digraph:
     add_events(dcr.events, graph, dcr.nestedgroups, dcr.nestedgroups, dcr.marking, parameters)
 
     # Add all relations between events
+    non_empty_groups = get_non_empty_groups(dcr.nestedgroups)
+    ancestors = {}
     for relation in dcr.relations:
         source = relation.start_event
         target = relation.target_event
         
         # Special handling for relations within same group/hierarchy
-        if (source.isGroup or target.isGroup) and (
-            source == target or 
-            is_ancestor_or_self(source, target) or 
-            is_ancestor_or_self(target, source)
-        ):
+        if (source.isGroup or target.isGroup) and is_same_hierarchy(source, target, ancestors):
             cluster_to_same_cluster(graph, relation, dcr.nestedgroups)
         else:
-            add_edgeDCR(relation, graph, dcr.nestedgroups)
+            add_edgeDCR(relation, graph, non_empty_groups)
 
     # Final graph formatting
     graph.attr(overlap='false') 
@@ -3,46 +3,49 @@ OCDCR graph visualizer.
 Extends basic visualization with support for objects, spawn and sync relations.
 """
 
+from itertools import chain
 from graphviz import Digraph
 from typing import Set, Dict
 from ocpa.objects.oc_dcr_graph.obj import OCDCRGraph, OCDCRRelation, Event
-from ocpa.visualization.oc_dcr_vis.variants.utils_viz import cluster_to_same_cluster, is_ancestor_or_self, get_edge_attrs, initialize_graph, add_events
+from ocpa.objects.oc_dcr_graph.obj.constants import IN_TOP_GRAPH
+from ocpa.visualization.oc_dcr_vis.variants.utils_viz import cluster_to_same_cluster, is_same_hierarchy, get_edge_headlabel, initialize_graph, add_events, get_non_empty_groups, add_relation_edge
 
 def add_edge(relation: OCDCRRelation, graph: Digraph, 
-             head_group_relations: Dict[Event, Set[Event]], 
-             tail_group_relations: Dict[Event, Set[Event]] = None) -> None:
+             head_groups: Set[Event], 
+             tail_groups: Set[Event] = None) -> None:
     """
     Add an edge to the graph, handling object-centric specific features.
     
     Args:
         relation: The relation to add
         graph: The Digraph to modify
-        head_group_relations: Nested groups relation for the source event/ both events if tail_group_relations is None
-        tail_group_relations: Nested groups relation for the target event (optional)
+        head_groups: Non-empty groups for the source event/ both events if tail_groups is None
+        tail_groups: Non-empty groups for the target event (optional)
     """
     source = relation.start_event
     target = relation.target_event
     
-    edge_attrs = get_edge_attrs(relation.type)
+    # Only attributes added to those of the relation type are collected
+    edge_attrs = {}
 
     # Handle quantifiers if present
     if hasattr(relation, "quantifier_head"):
         edge_attrs["taillabel"] = "∀" if relation.quantifier_head else ""
     if hasattr(relation, "quantifier_tail"):
-        edge_attrs["headlabel"] += (" ∀" if relation.quantifier_tail else "")
+        edge_attrs["headlabel"] = get_edge_headlabel(relation.type) + (" ∀" if relation.quantifier_tail else "")
 
-    # Handle edges to groups for target (either using tail_group_relations or head_group_relations if tail_group_relations is None)
-    if tail_group_relations:
-        if target.isGroup and target in tail_group_relations and tail_group_relations[target]:
+    # Handle edges to groups for target (either using tail_groups or head_groups if tail_groups is None)
+    if tail_groups:
+        if target.isGroup and target in tail_groups:
             edge_attrs["lhead"] = f"cluster_{target.activity}"
-    elif target.isGroup and target in head_group_relations and head_group_relations[target]:
+    elif target.isGroup and target in head_groups:
         edge_attrs["lhead"] = f"cluster_{target.activity}"
     
     # Handle edges from groups for source
-    if source.isGroup and source in head_group_relations and head_group_relations[source]:
+    if source.isGroup and source in head_groups:
         edge_attrs["ltail"] = f"cluster_{source.activity}"
 
-    graph.edge(source.activity, target.activity, **edge_attrs)
+    add_relation_edge(graph, source.activity, target.activity, relation.type, edge_attrs)
 
 def apply(ocdcr: OCDCRGraph, parameters: Dict = None) -> Digraph:
     """
@@ -60,8 +63,13 @@ def apply(ocdcr: OCDCRGraph, parameters: Dict = None) -> Digraph:
 
     add_events(ocdcr.events, graph, ocdcr.nestedgroups, ocdcr.nestedgroups, ocdcr.marking, parameters)
 
+    # Non-empty groups of every object, also used for the top level and sync relations below
+    object_groups = {}
+    ancestors = {}
+
     # Visualize object clusters
     for obj_id, obj in ocdcr.objects.items():
+        object_groups[obj_id] = get_non_empty_groups(obj.nestedgroups)
         cluster_name = f"cluster_{obj_id}"
         with graph.subgraph(name=cluster_name) as subgraph:
             if obj.spawn is None:
@@ -69,23 +77,20 @@ def apply(ocdcr: OCDCRGraph, parameters: Dict = None) -> Digraph:
             else:
                 color = "#E5EFF7"
             subgraph.attr(label=f"Object: {obj_id}", style="rounded,filled", fillcolor=color)
-            add_events(list(obj.events), subgraph, obj.nestedgroups, obj.nestedgroups,obj.marking, parameters)
+            add_events(obj.events, subgraph, obj.nestedgroups, obj.nestedgroups,obj.marking, parameters)
     
-            if list(obj.events):  # Check if there are any events
-                cluster_entry_points[obj_id] = list(obj.events)[0].activity
+            entry_event = next(iter(obj.events), None)
+            if entry_event is not None:  # Check if there are any events
+                cluster_entry_points[obj_id] = entry_event.activity
             
             # Add relations within this object
             for relation in obj.relations:
                 source = relation.start_event
                 target = relation.target_event
-                if (source.isGroup or target.isGroup) and (
-                    source == target or 
-                    is_ancestor_or_self(source, target) or 
-                    is_ancestor_or_self(target, source)
-                ):
+                if (source.isGroup or target.isGroup) and is_same_hierarchy(source, target, ancestors):
                     cluster_to_same_cluster(subgraph, relation, obj.nestedgroups)
                 else:
-                    add_edge(relation, subgraph, obj.nestedgroups)
+                    add_edge(relation, subgraph, object_groups[obj_id])
 
     # Add spawn relations between activities and objects
     if hasattr(ocdcr, 'spawn_relations'):
@@ -102,13 +107,14 @@ def apply(ocdcr: OCDCRGraph, parameters: Dict = None) -> Digraph:
                 )
 
     # Add top level relations and synchronization relations
-    for rel in getattr(ocdcr, 'relations', set()) | getattr(ocdcr, 'sync_relations', set()):
+    activity_to_object = ocdcr.activityToObject
+    for rel in chain(getattr(ocdcr, 'relations', ()), getattr(ocdcr, 'sync_relations', ())):
         # Determine which object contains the start and end events
-        # Get group relations for start and end events
-        head_groups = (ocdcr.objects[ocdcr.activityToObject[rel.start_event]].nestedgroups 
-                    if rel.start_event not in ocdcr.events else {})
-        tail_groups = (ocdcr.objects[ocdcr.activityToObject[rel.target_event]].nestedgroups 
-                    if rel.target_event not in ocdcr.events else {})
+        # Get non-empty groups for start and end events
+        start_obj = activity_to_object[rel.start_event]
+        target_obj = activity_to_object[rel.target_event]
+        head_groups = object_groups[start_obj] if start_obj is not IN_TOP_GRAPH else set()
+        tail_groups = object_groups[target_obj] if target_obj is not IN_TOP_GRAPH else set()
         
         add_edge(rel, graph, head_groups, tail_groups)
 
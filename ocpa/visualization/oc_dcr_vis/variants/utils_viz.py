@@ -107,6 +107,36 @@ def add_node(graph: Digraph, event: Event, group_relations: Dict[Event, Set[Even
                 for act in group_relations[event]:
                     add_node(subgraph, act, group_relations, marking,parameters)
 
+# Graphviz attributes for each relation type, copied per edge as callers extend them
+_EDGE_ATTRS = {
+    RelationTyps.I: {  # Include relation
+        "color": "#30A627",  # Green
+        "fontcolor": "#30A627",
+        "arrowhead": "normal", 
+        "headlabel": "+"  # + symbol for include
+    },
+    RelationTyps.E: {  # Exclude relation
+        "color": "#FC0C1B",  # Red
+        "fontcolor": "#FC0C1B",
+        "arrowhead": "normal", 
+        "headlabel": "%"  # % symbol for exclude
+    },
+    RelationTyps.R: {  # Response relation
+        "color": "#2993FC",  # Blue
+        "fontcolor": "#2993FC",
+        "arrowhead": "normal",
+        "arrowtail": "dot",
+        "dir": "both",  # Bidirectional
+        "headlabel": ""
+    },
+    RelationTyps.C: {  # Condition relation
+        "color": "#FFA500",  # Orange
+        "fontcolor": "#FFA500",
+        "arrowhead": "dotnormal", 
+        "headlabel": ""
+    }
+}
+
 def get_edge_attrs(relation_type: RelationTyps) -> Dict:
     """
     Get visualization attributes for different relation types.
@@ -117,34 +147,46 @@ def get_edge_attrs(relation_type: RelationTyps) -> Dict:
     Returns:
         Dictionary of Graphviz attributes for the edge
     """
-    return {
-        RelationTyps.I: {  # Include relation
-            "color": "#30A627",  # Green
-            "fontcolor": "#30A627",
-            "arrowhead": "normal", 
-            "headlabel": "+"  # + symbol for include
-        },
-        RelationTyps.E: {  # Exclude relation
-            "color": "#FC0C1B",  # Red
-            "fontcolor": "#FC0C1B",
-            "arrowhead": "normal", 
-            "headlabel": "%"  # % symbol for exclude
-        },
-        RelationTyps.R: {  # Response relation
-            "color": "#2993FC",  # Blue
-            "fontcolor": "#2993FC",
-            "arrowhead": "normal",
-            "arrowtail": "dot",
-            "dir": "both",  # Bidirectional
-            "headlabel": ""
-        },
-        RelationTyps.C: {  # Condition relation
-            "color": "#FFA500",  # Orange
-            "fontcolor": "#FFA500",
-            "arrowhead": "dotnormal", 
-            "headlabel": ""
-        }
-    }[relation_type]
+    return _EDGE_ATTRS[relation_type].copy()
+
+def get_edge_headlabel(relation_type: RelationTyps) -> str:
+    """
+    Get the head label of a relation type, the only attribute of get_edge_attrs that edges extend.
+    
+    Args:
+        relation_type: The type of DCR relation
+        
+    Returns:
+        The head label symbol of the relation type
+    """
+    return _EDGE_ATTRS[relation_type]["headlabel"]
+
+def add_relation_edge(graph: Digraph, tail_name: str, head_name: str,
+                      relation_type: RelationTyps, edge_attrs: Dict) -> None:
+    """
+    Add an edge for a relation, merging the attributes of its relation type with the edge's own attributes.
+    
+    Args:
+        graph: The Digraph to add the edge to
+        tail_name: Activity of the source node
+        head_name: Activity of the target node
+        relation_type: The type of the relation, edge_attrs extend its attributes from get_edge_attrs
+        edge_attrs: Attributes of the edge, either all of them or only those added to the relation type's attributes
+    """
+    # edge_attrs override the attributes of the relation type
+    graph.edge(tail_name, head_name, **{**_EDGE_ATTRS[relation_type], **edge_attrs})
+
+def get_non_empty_groups(group_relations: Dict[Event, Set[Event]]) -> Set[Event]:
+    """
+    Get the groups that have at least one member, edges from or to these groups are drawn to their cluster.
+    
+    Args:
+        group_relations: Dictionary mapping group events to their members
+        
+    Returns:
+        Set of group events with members
+    """
+    return {group for group, members in group_relations.items() if members}
 
 def is_ancestor_or_self(node: Event, other: Event) -> bool:
     """
@@ -164,6 +206,40 @@ def is_ancestor_or_self(node: Event, other: Event) -> bool:
         current = current.parent
     return False
 
+def get_ancestors_or_self(event: Event, cache: Dict[Event, Set[Event]]) -> Set[Event]:
+    """
+    Get an event and all its ancestors in the group hierarchy, memoized in cache.
+    
+    Args:
+        event: The event to get the ancestors for
+        cache: Ancestor sets computed so far, shared between calls for the same graph
+        
+    Returns:
+        Set containing the event and all its ancestors
+    """
+    ancestors = cache.get(event)
+    if ancestors is None:
+        if event.parent is None:
+            ancestors = {event}
+        else:
+            ancestors = get_ancestors_or_self(event.parent, cache) | {event}
+        cache[event] = ancestors
+    return ancestors
+
+def is_same_hierarchy(source: Event, target: Event, cache: Dict[Event, Set[Event]]) -> bool:
+    """
+    Check if one event is an ancestor of the other or both are the same, using memoized ancestor sets.
+    
+    Args:
+        source: The first event
+        target: The second event
+        cache: Ancestor sets computed so far, shared between calls for the same graph
+        
+    Returns:
+        True if source and target are in the same line of the group hierarchy, False otherwise
+    """
+    return target in get_ancestors_or_self(source, cache) or source in get_ancestors_or_self(target, cache)
+
 def cluster_to_same_cluster(graph: Digraph, relation: DCRRelation, 
                            groupRelation: Dict[Event, Set[Event]]) -> None:
     """
@@ -193,7 +269,7 @@ def cluster_to_same_cluster(graph: Digraph, relation: DCRRelation,
     # Make first segment invisible
     edge_attrs["arrowhead"] = "none"
     edge_attrs["headlabel"] = ""
-    graph.edge(source.activity, bridge_id, **edge_attrs)
+    add_relation_edge(graph, source.activity, bridge_id, relation.type, edge_attrs)
 
     # Second segment: from bridge to target
     edge_attrs = get_edge_attrs(relation.type)
@@ -201,7 +277,7 @@ def cluster_to_same_cluster(graph: Digraph, relation: DCRRelation,
         edge_attrs["headlabel"] += (" ∀" if relation.quantifier_tail else "")
     if target.isGroup and target in groupRelation and groupRelation[target]:
         edge_attrs["lhead"] = f"cluster_{target.activity}"
-    graph.edge(bridge_id, target.activity, **edge_attrs)
+    add_relation_edge(graph, bridge_id, target.activity, relation.type, edge_attrs)
 
 def add_events(events: list, graph: Digraph, group_relations: Dict[Event, Set[Event]], nestedgroups: Dict[Event, Set[Event]], marking:DCRMarking, parameters: Dict = None) -> None:
     """
@@ -214,23 +290,17 @@ def add_events(events: list, graph: Digraph, group_relations: Dict[Event, Set[Ev
         nestedgroups: Dictionary of nested group memberships
         parameters: Visualization parameters
     """
-    eventnodes = set()
+    processed_roots = set()
     for event in events:
-        if event not in eventnodes:
-            # Walk up the hierarchy to find the top-level parent
-            while event.parent is not None:
-                event = event.parent
-                if event in nestedgroups:
-                    eventnodes.update(nestedgroups.get(event, set()))
-            
-            eventnodes.add(event)
-            
-            # If this is a group, add all its members
-            if event.isGroup and event in nestedgroups:
-                eventnodes.update(nestedgroups.get(event, set()))
-            
-            # Add the node (or group) to the graph
-            add_node(graph, event, group_relations,marking, parameters)
-
-
-        
\ No newline at end of file
+        # Walk up the hierarchy to find the top-level parent
+        root = event
+        while root.parent is not None:
+            root = root.parent
+
+        # A top-level group is added together with all its members, only once
+        if root in processed_roots:
+            continue
+        processed_roots.add(root)
+
+        # Add the node (or group) to the graph
+        add_node(graph, root, group_relations, marking, parameters)
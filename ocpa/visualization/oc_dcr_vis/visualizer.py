@@ -1,4 +1,3 @@
-from copy import deepcopy
 from pm4py.visualization.common import gview
 from pm4py.visualization.common import save as gsave
 
@@ -7,7 +6,7 @@ from ocpa.visualization.oc_dcr_vis import object_centric as oc
 from ocpa.objects.oc_dcr_graph import OCDCRGraph
 
 def apply(dcr, parameters=None):
-    dcr = deepcopy(dcr)
+    # the variants only read the graph, so no copy is needed
     if isinstance(dcr, OCDCRGraph):
         return oc.apply(dcr, parameters)
     else:
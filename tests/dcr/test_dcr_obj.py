@@ -111,6 +111,20 @@ class TestEvent(unittest.TestCase):
         self.assertTrue(parent.isGroup)
         self.assertEqual(child.parent, parent)
 
+    def test_activity_is_interned(self):
+        name = "".join(["Interned", "Activity"])
+        event = Event(name)
+        self.assertIs(event.activity, Event("InternedActivity").activity)
+
+    def test_group_update_keeps_set_membership(self):
+        parent = Event("Parent")
+        child = Event("Child")
+        events = {parent, child}
+        parent.isGroup = True
+        child.parent = parent
+        self.assertIn(parent, events)
+        self.assertIn(child, events)
+
 class TestDCRRelation(unittest.TestCase):
     def setUp(self):
         self.event1 = Event("Activity1")
@@ -122,25 +136,37 @@ class TestDCRRelation(unittest.TestCase):
         self.assertEqual(relation.target_event, self.event2)
         self.assertEqual(relation.type, RelationTyps.R)
 
+    def test_cached_hash_matches_equal_relation(self):
+        relation = DCRRelation(self.event1, self.event2, RelationTyps.R)
+        self.assertEqual(hash(relation), hash(relation))
+        # an equal relation whose hash was not computed yet is found in a set
+        copy = DCRRelation(Event("Activity1"), Event("Activity2"), RelationTyps.R)
+        self.assertEqual(relation, copy)
+        self.assertIn(copy, {relation})
+
 class TestDCRGraph(unittest.TestCase):
-    def setUp(self):
-        self.graph = DCRGraph()
-        self.activity1 = "Activity1"
-        self.activity2 = "Activity2"
+    @classmethod
+    def setUpClass(cls):
+        # Events, relations and nested groups are only read by the tests and shared between them
+        cls.activity1 = "Activity1"
+        cls.activity2 = "Activity2"
         
-        self.event1 = Event(self.activity1)
-        self.event2 = Event(self.activity2)
-        self.group_event = Event("Group", isGroup=True)
-        self.nested_event = Event("Nested", parent=self.group_event)
+        cls.event1 = Event(cls.activity1)
+        cls.event2 = Event(cls.activity2)
+        cls.group_event = Event("Group", isGroup=True)
+        cls.nested_event = Event("Nested", parent=cls.group_event)
         
-        self.relation = DCRRelation(self.event1, self.event2, RelationTyps.R)
+        cls.relation = DCRRelation(cls.event1, cls.event2, RelationTyps.R)
+
+        cls.nested_groups = {cls.group_event: {cls.nested_event}}
+        cls.nested_events = {cls.nested_event}
+
+    def setUp(self):
+        self.graph = DCRGraph()
         
         self.marking = DCRMarking()
         self.marking.add_event(self.event1, MarkingTyps.E)
         self.marking.add_event(self.event2, MarkingTyps.I)
-        
-        self.nested_groups = {self.group_event: {self.nested_event}}
-        self.nested_events = {self.nested_event}
 
     def test_from_attributes_creates_graph(self):
         """Test that from_attributes creates a valid DCRGraph instance"""
@@ -164,8 +190,8 @@ class TestDCRGraph(unittest.TestCase):
             nested_events=set()
         )
         self.assertEqual(len(graph.relations), 1)
-        relation = next(iter(graph.relations))
-        self.assertEqual(relation.type, RelationTyps.R)
+        relation = graph.get_relation(self.event1, self.event2, RelationTyps.R)
+        self.assertEqual(relation, self.relation)
 
     def test_from_attributes_with_nested_groups(self):
         """Test that nested group structure is maintained"""
@@ -179,8 +205,9 @@ class TestDCRGraph(unittest.TestCase):
         
         # Verify the group structure
         self.assertEqual(len(graph.nestedgroups), 1)
-        parent = next(iter(graph.nestedgroups.keys()))
-        child = next(iter(graph.nestedgroups[parent]))
+        parent = graph.get_event(self.group_event.activity)
+        child = graph.get_event(self.nested_event.activity)
+        self.assertIn(child, graph.nestedgroups[parent])
         self.assertEqual(child.parent, parent)
 
     def test_from_attributes_with_marking(self):
@@ -193,8 +220,25 @@ class TestDCRGraph(unittest.TestCase):
             nested_events=set()
         )
         self.assertEqual(len(graph.marking.executed), 1)
-        self.assertEqual(len(graph.marking.included), 1)  
-        
+        self.assertEqual(len(graph.marking.included), 1)
+
+    def test_from_attributes_copies_containers(self):
+        """Test that the graph does not modify the given containers"""
+        relations = {self.relation}
+        graph = DCRGraph.from_attributes(
+            events={self.event1, self.event2},
+            relations=relations,
+            marking=self.marking,
+            nested_groups=self.nested_groups,
+            nested_events=self.nested_events
+        )
+        graph.remove_event(graph.get_event(self.activity1))
+        graph.nestedgroups[self.group_event].clear()
+
+        self.assertEqual(relations, {self.relation})
+        self.assertIn(self.event1, self.marking.executed)
+        self.assertEqual(self.nested_groups, {self.group_event: {self.nested_event}})
+
     def test_add_event(self):
         self.graph.add_event(self.activity1)
         self.assertEqual(len(self.graph.events), 1)
@@ -386,6 +430,44 @@ class TestDCRGraph(unittest.TestCase):
             self.graph.get_relation(case_sensitive_event, event2, RelationTyps.I)
         )
 
+    def test_relation_index_follows_changes(self):
+        event1 = self.graph.add_event(self.activity1)
+        event2 = self.graph.add_event(self.activity2)
+        self.graph.add_relation(event1, event2, RelationTyps.I)
+
+        # removing an equal copy also removes the indexed relation
+        self.assertTrue(self.graph.remove_relation(DCRRelation(event1, event2, RelationTyps.I)))
+        self.assertIsNone(self.graph.get_relation(event1, event2, RelationTyps.I))
+
+        # relations added without the graph API are found as well
+        self.graph.relations.add(DCRRelation(event2, event1, RelationTyps.C))
+        self.assertEqual(self.graph.get_relation(event2, event1, RelationTyps.C),
+                         DCRRelation(event2, event1, RelationTyps.C))
+
+        # also when another relation is removed without the graph API, so that the size stays the same
+        self.graph.relations.discard(DCRRelation(event2, event1, RelationTyps.C))
+        self.graph.relations.add(DCRRelation(event1, event2, RelationTyps.R))
+        self.assertIsNone(self.graph.get_relation(event2, event1, RelationTyps.C))
+        self.assertEqual(self.graph.get_relation(event1, event2, RelationTyps.R),
+                         DCRRelation(event1, event2, RelationTyps.R))
+
+    def test_relation_index_follows_same_size_modifications(self):
+        event_a = self.graph.add_event("A")
+        event_b = self.graph.add_event("B")
+        event_c = self.graph.add_event("C")
+        self.graph.add_relation(event_a, event_b, RelationTyps.I)
+        self.assertIsNotNone(self.graph.get_relation(event_a, event_b, RelationTyps.I))
+
+        # replacing the only relation keeps the size of the relation set
+        relation = DCRRelation(event_a, event_c, RelationTyps.E)
+        self.graph.relations.clear()
+        self.graph.relations.add(relation)
+
+        self.assertIs(self.graph.get_relation(event_a, event_c, RelationTyps.E), relation)
+        self.assertIsNone(self.graph.get_relation(event_a, event_b, RelationTyps.I))
+        self.assertEqual(self.graph.get_incidental_relations(event_c), {relation})
+        self.assertEqual(self.graph.get_incidental_relations(event_b), set())
+
     def test_remove_relation(self):
         # Setup test events and relations
         event1 = self.graph.add_event(self.activity1)
@@ -452,7 +534,27 @@ class TestDCRGraph(unittest.TestCase):
         self.graph.add_event(self.activity1)
         event = self.graph.get_event(self.activity1)
         self.assertEqual(event.activity, self.activity1)
-        
+
+    def test_get_event_follows_modifications(self):
+        event1 = self.graph.add_event(self.activity1)
+        self.graph.remove_event(event1)
+        self.assertIsNone(self.graph.get_event(self.activity1))
+
+        # events added without the graph API are found as well
+        self.graph.events.add(self.event2)
+        self.assertIs(self.graph.get_event(self.activity2), self.event2)
+
+    def test_get_event_follows_same_size_modifications(self):
+        event_a = self.graph.add_event("A")
+        self.assertIs(self.graph.get_event("A"), event_a)
+
+        # swapping an event keeps the size of the event set
+        event_z = Event("Z")
+        self.graph.events.discard(event_a)
+        self.graph.events.add(event_z)
+        self.assertIs(self.graph.get_event("Z"), event_z)
+        self.assertIsNone(self.graph.get_event("A"))
+
     def test_add_nested_group_strings(self):
         self.graph.add_event("Parent")
         self.graph.add_event("Child1")
@@ -827,12 +929,10 @@ class TestOCDCRObject(unittest.TestCase):
         self.assertEqual(len(dcr_graph.marking.executed), 1)
         self.assertEqual(len(dcr_graph.marking.included), 2) #event1 + spawn
         
-        # Find the events to check their markings
-        for event in dcr_graph.events:
-            if event.activity == "Activity1":
-                self.assertIn(MarkingTyps.E, dcr_graph.marking.get_event_marking(event))
-            elif event.activity == "SpawnActivity":
-                self.assertIn(MarkingTyps.I, dcr_graph.marking.get_event_marking(event))
+        # Look up the events to check their markings
+        event = dcr_graph.get_event("Activity1")
+        self.assertIn(MarkingTyps.E, dcr_graph.marking.get_event_marking(event))
+        self.assertIn(MarkingTyps.I, dcr_graph.marking.get_event_marking(self.spawn_event))
 
     def test_nested_group_conversion(self):
         """Test that nested groups are preserved"""
@@ -844,11 +944,11 @@ class TestOCDCRObject(unittest.TestCase):
         
         # Verify group structure
         self.assertEqual(len(dcr_graph.nestedgroups), 1)
-        copied_group = next(iter(dcr_graph.nestedgroups.keys()))
-        copied_nested = next(iter(dcr_graph.nestedgroups[copied_group]))
+        copied_group = dcr_graph.get_event("Group")
+        copied_nested = dcr_graph.get_event("Nested")
         
-        self.assertEqual(copied_group.activity, "Group")
-        self.assertEqual(copied_nested.activity, "Nested")
+        self.assertIn(copied_group, dcr_graph.nestedgroups)
+        self.assertIn(copied_nested, dcr_graph.nestedgroups[copied_group])
         self.assertEqual(copied_nested.parent, copied_group)
         
     def test_object_id_setter(self):
@@ -1008,6 +1108,25 @@ class TestOCDCRGraph(unittest.TestCase):
         self.assertIn("Activity1", activities)
         self.assertIn("GlobalActivity", activities)
 
+    def test_events_cached_until_change(self):
+        self.graph.add_event("Global1")
+        events = self.graph.get_events()
+        self.assertIs(self.graph.get_events(), events)
+        self.assertIsInstance(events, frozenset)
+
+        self.graph.add_object(self.obj)
+        direct = Event("Direct")
+        self.obj.events.add(direct)
+        self.assertEqual(len(self.graph.get_events()), 3)
+
+        # swapping an event of an object keeps the size of its event set
+        swapped = Event("Swapped")
+        self.obj.events.discard(direct)
+        self.obj.events.add(swapped)
+        events = self.graph.get_events()
+        self.assertIn(swapped, events)
+        self.assertNotIn(direct, events)
+
     def test_get_events_simple(self):
         # Test empty graph
         self.assertEqual(len(self.graph.get_events()), 0)
@@ -1105,6 +1224,41 @@ class TestOCDCRGraph(unittest.TestCase):
         non_existent = self.graph.get_event("NonExistent")
         self.assertIsNone(non_existent)
 
+    def test_get_event_index_follows_modifications(self):
+        self.graph.add_object(self.obj)
+        event = self.graph.add_event("GlobalActivity")
+        self.assertIs(self.graph.get_event("GlobalActivity"), event)
+
+        # removed events are no longer found
+        self.graph.remove_event(event)
+        self.assertIsNone(self.graph.get_event("GlobalActivity"))
+
+        # events added directly to an object are found as well
+        direct = Event("DirectActivity")
+        self.obj.events.add(direct)
+        self.assertIs(self.graph.get_event("DirectActivity"), direct)
+
+        # swapping an event of an object keeps the size of its event set
+        other = self.graph.add_event("OtherActivity", obj=self.obj)
+        swapped = Event("SwappedActivity")
+        self.obj.events.discard(other)
+        self.obj.events.add(swapped)
+        self.assertIs(self.graph.get_event("SwappedActivity"), swapped)
+        self.assertIsNone(self.graph.get_event("OtherActivity"))
+
+    def test_activities_view(self):
+        self.graph.add_object(self.obj)
+        event = self.graph.add_event("GlobalActivity")
+        view = self.graph.activities_view()
+        self.assertIn(event, view)
+
+        # the view follows later changes without being requested again
+        direct = Event("DirectActivity")
+        self.obj.events.add(direct)
+        self.assertIn(direct, self.graph.activities_view())
+        self.graph.remove_event(event)
+        self.assertNotIn(event, view)
+
     def test_add_simple_event(self):
         """Test adding a basic event to top level"""
         event = self.graph._add_event_to_top_level(self.activity1)
@@ -1334,6 +1488,26 @@ class TestOCDCRGraph(unittest.TestCase):
         self.assertTrue(r.quantifier_head)
         self.assertTrue(r.quantifier_tail)
 
+    def test_partition_upgrades_existing_relation(self):
+        g = OCDCRGraph()
+
+        obj1 = OCDCRObject(Event("Spawn1"), "o1")
+        obj2 = OCDCRObject(Event("Spawn2"), "o2")
+        e1 = obj1.add_event("E1")
+        e2 = obj2.add_event("E2")
+        g.add_object(obj1)
+        g.add_object(obj2)
+
+        g.add_relation(e1, e2, RelationTyps.C)
+        existing = g.get_relation(e1, e2, RelationTyps.C)
+
+        g.partition({DCRRelation(e1, e2, RelationTyps.C)})
+
+        self.assertEqual(len(g.sync_relations), 1)
+        self.assertIs(g.get_relation(e1, e2, RelationTyps.C), existing)
+        self.assertTrue(existing.quantifier_head)
+        self.assertTrue(existing.quantifier_tail)
+
     def test_add_relation(self):
         self.obj.add_event("Obj1_Activity1")
         self.obj.add_event("Obj1_Activity2")
@@ -1413,6 +1587,17 @@ class TestOCDCRGraph(unittest.TestCase):
         self.assertEqual(rel.start_event.activity, "Activity1")
         self.assertEqual(rel.target_event.activity, "Activity2")
 
+    def test_all_relations_cached_until_change(self):
+        self.event1 = self.graph.add_event("Activity1")
+        self.event2 = self.graph.add_event("Activity2")
+        self.graph.add_relation(self.event1, self.event2, RelationTyps.R)
+        relations = self.graph.get_all_relations()
+        self.assertIs(self.graph.get_all_relations(), relations)
+
+        self.graph.add_relation(self.event2, self.event1, RelationTyps.C)
+        self.assertEqual(len(self.graph.get_all_relations()), 2)
+        self.assertEqual(len(relations), 1)
+
     def test_object_relations(self):
         self.graph.add_object(self.obj)
         self.event1 = self.graph.add_event("Activity1")
@@ -1562,6 +1747,40 @@ class TestOCDCRGraph(unittest.TestCase):
         rel_types = {rel.type for rel in relations}
         self.assertEqual(rel_types, {RelationTyps.R, RelationTyps.C, RelationTyps.I, RelationTyps.E})
 
+    def test_incidental_relations_follow_direct_modifications(self):
+        self.graph.add_object(self.obj)
+        self.event1 = self.graph.add_event("Activity1")
+        self.event2 = self.graph.add_event("Activity2")
+        self.graph.add_relation(self.event1, self.event2, RelationTyps.R)
+        self.assertEqual(len(self.graph.get_incidental_relations(self.event1)), 1)
+
+        # relations added to the set directly are found as well
+        relation = OCDCRRelation(self.event2, self.event1, RelationTyps.C)
+        self.graph.relations.add(relation)
+        self.assertIn(relation, self.graph.get_incidental_relations(self.event1))
+        self.assertEqual(self.graph.get_relation(self.event2, self.event1, RelationTyps.C), relation)
+
+        # removed relations are no longer incidental
+        self.assertTrue(self.graph.remove_relation(relation))
+        self.assertNotIn(relation, self.graph.get_incidental_relations(self.event1))
+        self.assertIsNone(self.graph.get_relation(self.event2, self.event1, RelationTyps.C))
+
+        # swapping relations directly keeps the size of the relation sets
+        event3 = self.graph.add_event("Activity3")
+        swapped = OCDCRRelation(self.event2, event3, RelationTyps.E)
+        self.graph.relations.clear()
+        self.graph.relations.add(swapped)
+        self.assertEqual(self.graph.get_incidental_relations(self.event1), set())
+        self.assertEqual(self.graph.get_incidental_relations(event3), {swapped})
+
+        obj_event = self.graph.add_event("ObjActivity", obj=self.obj)
+        self.graph._add_sync_relation("Activity1", "ObjActivity", RelationTyps.R)
+        sync_swapped = OCDCRRelation(obj_event, self.event2, RelationTyps.I, True, True)
+        self.graph.sync_relations.clear()
+        self.graph.sync_relations.add(sync_swapped)
+        self.assertEqual(self.graph.get_incidental_relations(self.event1), set())
+        self.assertEqual(self.graph.get_incidental_relations(obj_event), {sync_swapped})
+
     def test_incidental_relations_non_existent_event(self):
         """Test that get_incidental_relations raises KeyError for non-existent event"""
         g = OCDCRGraph()
@@ -1645,6 +1864,37 @@ class TestOCDCRGraph(unittest.TestCase):
         self.assertEqual(self.graph.activityToObject[group], "type1")
         self.assertEqual(self.graph.activityToObject[nested], "type1")
 
+    def test_activities_mapped_without_update_call(self):
+        self.graph = OCDCRGraph()
+        self.obj1 = OCDCRObject(Event("Spawn1"), "type1")
+        self.graph.add_object(self.obj1)
+
+        # events added through the graph, including a new parent group
+        nested = self.graph.add_event("Nested", parent="Group", obj="type1")
+        self.assertEqual(self.graph.activityToObject[nested], "type1")
+        self.assertEqual(self.graph.activityToObject[nested.parent], "type1")
+
+        # events added directly to the object
+        direct = self.obj1.add_event("Direct")
+        self.assertEqual(self.graph.activityToObject[direct], "type1")
+
+    def test_activities_follow_same_size_modifications(self):
+        self.graph = OCDCRGraph()
+        self.obj1 = OCDCRObject(Event("Spawn1"), "type1")
+        self.graph.add_object(self.obj1)
+        removed = self.graph.add_event("Removed", obj="type1")
+        self.assertEqual(self.graph.activityToObject[removed], "type1")
+
+        # swapping an event of the object keeps the size of its event set
+        swapped = Event("Swapped")
+        self.obj1.events.discard(removed)
+        self.obj1.events.add(swapped)
+        self.assertNotIn(removed, self.graph.activityToObject)
+        self.assertEqual(self.graph.activityToObject[swapped], "type1")
+        self.assertIs(self.graph.corr(swapped), self.obj1)
+        with self.assertRaises(KeyError):
+            self.graph.corr(removed)
+
     def test_remove_top_level_relation(self):
         """Test removing relation between top-level events"""
         # Add events and relation using only setup variables
@@ -1667,6 +1917,18 @@ class TestOCDCRGraph(unittest.TestCase):
         self.graph.remove_relation(rel)
         self.assertNotIn(rel, self.obj.relations)
 
+    def test_remove_top_level_event_with_sync_relation(self):
+        """Test removing a top-level event also removes its relations to object events"""
+        self.graph.add_object(self.obj)
+        event1 = self.graph.add_event(self.activity1)
+        event2 = self.graph.add_event(self.activity2, obj=self.obj)
+        self.graph.add_relation(event1, event2, RelationTyps.R)
+        self.assertEqual(len(self.graph.sync_relations), 1)
+
+        self.graph.remove_event(event1)
+        self.assertEqual(len(self.graph.sync_relations), 0)
+        self.assertEqual(self.graph.get_incidental_relations(event2), set())
+
     def test_remove_nonexistent_relation(self):
         """Test removing relation that doesn't exist"""
         # Create relation without adding it
@@ -1807,6 +2069,22 @@ class TestCorrelation_Spawn_OCDCR(unittest.TestCase):
         rel = OCDCRRelation(e1, e2, RelationTyps.C)
         self.assertIn(rel, obj.relations)
 
+    def test_grouping_keeps_sync_relations(self):
+        g = OCDCRGraph()
+        obj = OCDCRObject(Event("Spawn"), "Item")
+        g.add_object(obj)
+        item_event = g.add_event("Add Item", obj="Item")
+        e1 = g.add_event("A")
+        g.add_relation(e1, item_event, RelationTyps.R, True, False)
+
+        g.group_top_level_events_into_unspawned_object({e1}, "Unspawned")
+
+        self.assertEqual(g.activityToObject[e1], "Unspawned")
+        self.assertEqual(len(g.sync_relations), 1)
+        rel = next(iter(g.sync_relations))
+        self.assertEqual(rel.get_quantifiers(), (True, False))
+        self.assertEqual(g.get_incidental_relations(e1), {rel})
+
     def test_empty_event_set_ok(self):
         g = OCDCRGraph()
         g.group_top_level_events_into_unspawned_object(set(), "Ghost")
@@ -1853,6 +2131,26 @@ class TestOCDCRRelation(unittest.TestCase):
         relation5 = OCDCRRelation(event1, event2, RelationTyps.R, True, False)
         self.assertEqual(relation5.type, RelationTyps.R)  # Type should remain unchanged
 
+    def test_quantifier_update_keeps_set_membership(self):
+        relation = OCDCRRelation(self.event1, self.event2, RelationTyps.R)
+        relations = {relation}
+        relation.quantifier_head = True
+        self.assertIn(relation, relations)
+        relations.discard(relation)
+        self.assertEqual(len(relations), 0)
+
+    def test_add_relation_replaces_plain_relation(self):
+        graph = OCDCRGraph()
+        event1 = graph.add_event("Activity1")
+        event2 = graph.add_event("Activity2")
+        graph.relations.add(DCRRelation(event1, event2, RelationTyps.E))
+
+        graph.add_relation(event1, event2, RelationTyps.E, True, True)
+        self.assertEqual(len(graph.relations), 1)
+        relation = graph.get_relation(event1, event2, RelationTyps.E)
+        self.assertIsInstance(relation, OCDCRRelation)
+        self.assertEqual(relation.get_quantifiers(), (True, True))
+
 
 if __name__ == '__main__':
     unittest.main()
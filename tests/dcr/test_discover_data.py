@@ -1,10 +1,6 @@
 import unittest
 
-from test_setup import SetUpOCDCRTest, RESULTS_DIR
-
-import os
-
-from ocpa.objects.log.importer.ocel import factory as ocel_import_factory
+from test_setup import SetUpOCDCRTest
 
 from ocpa.algo.discovery.oc_dcr.util import DiscoverData, SPAWN, ErrorManager
 from ocpa.objects.oc_dcr_graph import IN_TOP_GRAPH, Event
@@ -57,7 +53,7 @@ class TestDiscover(SetUpOCDCRTest):
 class TestErrorManager(SetUpOCDCRTest):
 
     def setUp(self):
-        self.ocel = ocel_import_factory.apply(os.path.join(RESULTS_DIR, "jsonocel/test_log.jsonocel"))
+        # self.ocel is imported once per class in SetUpOCDCRTest.setUpClass
         self.valid_spawn_mapping = {
             "Order": "Create Order",
             "Item": "Add Item"
@@ -1,6 +1,7 @@
 from test_setup import SetUpOCDCRTest, RESULTS_DIR
 
 import os
+import tempfile
 
 from ocpa.objects.log.importer.ocel import factory as ocel_import_factory
 
@@ -41,7 +42,10 @@ class TestDiscoverPipeline(SetUpOCDCRTest):
             import ocpa.visualization.oc_dcr_vis as dcr_viz
 
             viz = dcr_viz.apply(result)
-            dcr_viz.save(viz, "testtttt.png")
+            # rendering needs graphviz and is only useful to inspect the result by hand
+            if os.environ.get("OCDCR_DUMP_VIZ"):
+                with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+                    dcr_viz.save(viz, f.name)
 
             # Sync relation presence
             self.assertGreater(len(result.sync_relations), 0)
@@ -17,11 +17,21 @@ from ocpa.objects.oc_dcr_graph import IN_TOP_GRAPH
 import os
 
 class TestInitialDiscovery(SetUpOCDCRTest):
+    _oc_dcr = None
 
     def setUp(self):
         super().setUp()
         self.discoverer = InitialDiscovery(self.data)
 
+    def _discover_oc_dcr(self) -> OCDCRGraph:
+        # the discovery is deterministic and the tests only read its result, so it runs once per class
+        cls = type(self)
+        if cls._oc_dcr is None:
+            flat_log = self.discoverer.extract_object_traces()
+            mined_dcr = self.discoverer.apply_dcr_discover(flat_log)
+            cls._oc_dcr = self.discoverer.translate_to_basic_ocgraph_structure(mined_dcr)
+        return cls._oc_dcr
+
     def test_extract_object_traces_matches_expected_dataframe(self):
         actual_df = self.discoverer.extract_object_traces()
 
@@ -65,16 +75,13 @@ class TestInitialDiscovery(SetUpOCDCRTest):
 
         # Überprüfe, ob nun alle Aktivitäten vorhanden sind
         final_activities = {e.activity for e in updated_dcr.events}
-        for expected_activity in self.data.get_activities():
-            self.assertIn(expected_activity, final_activities)
+        self.assertEqual(self.data.get_activities() - final_activities, set())
 
 
 
 
     def test_ocdcr_graph_structure(self):
-        flat_log = self.discoverer.extract_object_traces()
-        mined_dcr = self.discoverer.apply_dcr_discover(flat_log)
-        oc_dcr = self.discoverer.translate_to_basic_ocgraph_structure(mined_dcr)
+        oc_dcr = self._discover_oc_dcr()
 
         # test if translate to oc_dcr has the right structure
         self.assertIsInstance(oc_dcr, OCDCRGraph)
@@ -86,9 +93,7 @@ class TestInitialDiscovery(SetUpOCDCRTest):
             self.assertIn(obj, self.data.ocel.object_types)
 
     def test_exclude_relation_removed(self):
-        flat_log = self.discoverer.extract_object_traces()
-        mined_dcr = self.discoverer.apply_dcr_discover(flat_log)
-        oc_dcr = self.discoverer.translate_to_basic_ocgraph_structure(mined_dcr)
+        oc_dcr = self._discover_oc_dcr()
 
         excluded = set()
         for rel in oc_dcr.relations:
@@ -106,8 +111,8 @@ class TestInitialDiscovery(SetUpOCDCRTest):
         mined_dcr = self.discoverer.apply_dcr_discover(flat_log)
 
         # Add manual cross-object relation
-        link_item_event = next(e for e in mined_dcr.events if e.activity == "Link Item to Order")
-        ship_order_event = next(e for e in mined_dcr.events if e.activity == "Ship Order")
+        link_item_event = mined_dcr.get_event("Link Item to Order")
+        ship_order_event = mined_dcr.get_event("Ship Order")
 
         cross_relation = DCRRelation(start_event=link_item_event, target_event=ship_order_event, type=RelationTyps.C)
         mined_dcr.relations.add(cross_relation)
@@ -125,9 +130,7 @@ class TestInitialDiscovery(SetUpOCDCRTest):
         self.assertFalse(still_exists, "Cross-object relation was not removed from OC-DCR.")
 
     def test_top_to_subgraph_relations_have_quantifiers(self):
-        flat_log = self.discoverer.extract_object_traces()
-        mined_dcr = self.discoverer.apply_dcr_discover(flat_log)
-        oc_dcr: OCDCRGraph = self.discoverer.translate_to_basic_ocgraph_structure(mined_dcr)
+        oc_dcr: OCDCRGraph = self._discover_oc_dcr()
 
         violations = []
 
@@ -148,9 +151,7 @@ class TestInitialDiscovery(SetUpOCDCRTest):
         )
 
     def test_top_level_activities_have_no_quantifiers(self):
-        flat_log = self.discoverer.extract_object_traces()
-        mined_dcr = self.discoverer.apply_dcr_discover(flat_log)
-        oc_dcr: OCDCRGraph = self.discoverer.translate_to_basic_ocgraph_structure(mined_dcr)
+        oc_dcr: OCDCRGraph = self._discover_oc_dcr()
 
         violations = []
 
@@ -173,9 +174,7 @@ class TestInitialDiscovery(SetUpOCDCRTest):
         )
 
     def test_no_relation_between_spawn_and_spawned_activities(self):
-        flat_log = self.discoverer.extract_object_traces()
-        mined_dcr = self.discoverer.apply_dcr_discover(flat_log)
-        oc_dcr: OCDCRGraph = self.discoverer.translate_to_basic_ocgraph_structure(mined_dcr)
+        oc_dcr: OCDCRGraph = self._discover_oc_dcr()
 
         violations = []
 
@@ -195,9 +194,7 @@ class TestInitialDiscovery(SetUpOCDCRTest):
         )
 
     def test_spawn_events_correctly_assigned(self):
-        flat_log = self.discoverer.extract_object_traces()
-        mined_dcr = self.discoverer.apply_dcr_discover(flat_log)
-        oc_dcr: OCDCRGraph = self.discoverer.translate_to_basic_ocgraph_structure(mined_dcr)
+        oc_dcr: OCDCRGraph = self._discover_oc_dcr()
 
         violations = []
 
@@ -225,7 +222,7 @@ class TestToRelations(unittest.TestCase):
         self.mock_oc_dcr = MagicMock()
 
         # Example mock event mappings
-        self.mock_oc_dcr.get_event.side_effect = lambda x: f"event_{x}"
+        self.mock_oc_dcr.get_event.side_effect = lambda x: Event(f"event_{x}")
 
     def test_to_relations_conditions(self):
         relations: Dict[str, Set[str]] = {
@@ -236,9 +233,9 @@ class TestToRelations(unittest.TestCase):
         result = self.logic._to_relations(relations, RelationTyps.C, self.mock_oc_dcr)
 
         expected = {
-            OCDCRRelation("event_source1", "event_target1", RelationTyps.C, True, True),
-            OCDCRRelation("event_source2", "event_target1", RelationTyps.C, True, True),
-            OCDCRRelation("event_source3", "event_target2", RelationTyps.C, True, True)
+            OCDCRRelation(Event("event_source1"), Event("event_target1"), RelationTyps.C, True, True),
+            OCDCRRelation(Event("event_source2"), Event("event_target1"), RelationTyps.C, True, True),
+            OCDCRRelation(Event("event_source3"), Event("event_target2"), RelationTyps.C, True, True)
         }
 
         self.assertEqual(result, expected)
@@ -252,9 +249,9 @@ class TestToRelations(unittest.TestCase):
         result = self.logic._to_relations(relations, RelationTyps.R, self.mock_oc_dcr)
 
         expected = {
-            OCDCRRelation("event_source1", "event_target1", RelationTyps.R, True, True),
-            OCDCRRelation("event_source2", "event_target2", RelationTyps.R, True, True),
-            OCDCRRelation("event_source2", "event_target3", RelationTyps.R, True, True)
+            OCDCRRelation(Event("event_source1"), Event("event_target1"), RelationTyps.R, True, True),
+            OCDCRRelation(Event("event_source2"), Event("event_target2"), RelationTyps.R, True, True),
+            OCDCRRelation(Event("event_source2"), Event("event_target3"), RelationTyps.R, True, True)
         }
 
         self.assertEqual(result, expected)
@@ -385,6 +382,30 @@ class TestProcessTraces(unittest.TestCase):
         self.assertEqual(sync_responses["spawned_A"], {"spawned_B"})  # "B" after "A"
         self.assertEqual(sync_responses["spawned_B"], set())  # No B after B
 
+    def test_process_traces_checks_all_spawned_instances(self):
+        # two orders are spawned, all "spawned_A" events happen before all "spawned_B" events
+        self.data_mock.ocel.obj.raw.objects["o2"] = MagicMock(type="Order")
+        log_data = [
+            {"case:concept:name": "case1", "concept:name": "spawn_order", "time:timestamp": 1, "object_id": "o1"},
+            {"case:concept:name": "case1", "concept:name": "spawn_order", "time:timestamp": 2, "object_id": "o2"},
+            {"case:concept:name": "case1", "concept:name": "spawned_A", "time:timestamp": 3, "object_id": "o1"},
+            {"case:concept:name": "case1", "concept:name": "spawned_A", "time:timestamp": 4, "object_id": "o2"},
+            {"case:concept:name": "case1", "concept:name": "spawned_B", "time:timestamp": 5, "object_id": "o1"},
+            {"case:concept:name": "case1", "concept:name": "spawned_B", "time:timestamp": 6, "object_id": "o2"},
+        ]
+        df = pl.DataFrame(log_data)
+
+        sync_conditions = {"spawned_A": {"spawned_B"}, "spawned_B": {"spawned_A"}}
+        sync_responses = {"spawned_A": {"spawned_B"}, "spawned_B": {"spawned_A"}}
+        all_activities = {"spawned_A", "spawned_B", "spawn_order"}
+
+        self.logic._process_traces(sync_conditions, sync_responses, all_activities, df)
+
+        self.assertEqual(sync_conditions["spawned_A"], set())
+        self.assertEqual(sync_conditions["spawned_B"], {"spawned_A"})  # both A before each B
+        self.assertEqual(sync_responses["spawned_A"], {"spawned_B"})  # both B after each A
+        self.assertEqual(sync_responses["spawned_B"], set())  # No A after any B
+
 
 class TestDiscoverLogic(SetUpOCDCRTest):
 
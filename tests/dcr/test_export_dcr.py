@@ -1,6 +1,6 @@
 import unittest
+import io
 import xml.etree.ElementTree as ET
-import os
 
 from ocpa.objects.oc_dcr_graph import DCRGraph, RelationTyps, MarkingTyps
 
@@ -26,22 +26,18 @@ class TestDCRGraphExport(unittest.TestCase):
         graph.add_relation('Event8', 'Event1', RelationTyps.I)
         graph.add_relation('Event1', 'Event4', RelationTyps.E)
 
-        # Export to XML
-        cls.filename = 'test_ocdcr_export.xml'
-        graph.export_as_xml(cls.filename, 'Test DCR Export')
+        # Export to XML in memory, the exporter accepts file objects as well as paths
+        buffer = io.BytesIO()
+        graph.export_as_xml(buffer, 'Test DCR Export')
 
         # from ocpa.visualization.oc_dcr_vis import apply, view
         # view(apply(graph))
 
         # Parse exported XML
-        cls.tree = ET.parse(cls.filename)
+        buffer.seek(0)
+        cls.tree = ET.parse(buffer)
         cls.root = cls.tree.getroot()
 
-    @classmethod
-    def tearDownClass(cls):
-        if os.path.exists(cls.filename):
-            os.remove(cls.filename)
-
     def test_event_structure(self):
         events = self.root.find('.//resources/events')
         self.assertIsNotNone(events.find("./event[@id='Event2']"))
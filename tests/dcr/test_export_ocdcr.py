@@ -1,6 +1,6 @@
 import unittest
+import io
 import xml.etree.ElementTree as ET
-import os
 
 from ocpa.objects.oc_dcr_graph import OCDCRGraph, RelationTyps, MarkingTyps, OCDCRObject, Event
 
@@ -30,23 +30,18 @@ class TestOCDCRXML(unittest.TestCase):
 
         graph.add_relation('Object2_Event1', 'Object1_Event2', RelationTyps.R, True, True)
 
-        # Export to XML
-        cls.filename = 'test_ocdcr_export.xml'
-        graph.export_as_xml(cls.filename)
+        # Export to XML in memory, the exporter accepts file objects as well as paths
+        buffer = io.BytesIO()
+        graph.export_as_xml(buffer)
 
         #from ocpa.visualization.oc_dcr_vis import apply, view
         #view(apply(graph))
 
         # Parse exported XML
-        cls.tree = ET.parse(cls.filename)
+        buffer.seek(0)
+        cls.tree = ET.parse(buffer)
         cls.root = cls.tree.getroot()
 
-    @classmethod
-    def tearDownClass(cls):
-        # Clean up the exported file
-        if os.path.exists(cls.filename):
-            os.remove(cls.filename)
-
     def test_event_hierarchy_structure(self):
         events = self.root.find('.//resources/events')
         event2 = events.find('./event[@id=\'Event2\']')
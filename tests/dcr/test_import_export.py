@@ -0,0 +1,35 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from ocpa.util.dcr.import_export import _parse_object_column
+
+
+class TestParseObjectColumn(unittest.TestCase):
+
+    def test_simple_lists_and_sets(self):
+        column = pd.Series(["['o1', 'o2']", "{'o3'}", "['o4',]"])
+        parsed = _parse_object_column(column)
+        self.assertEqual(parsed[0], ['o1', 'o2'])
+        self.assertEqual(parsed[1], {'o3'})
+        self.assertEqual(parsed[2], ['o4'])
+
+    def test_empty_values(self):
+        column = pd.Series(["set()", np.nan, "[]", "{}"])
+        parsed = _parse_object_column(column)
+        self.assertEqual(list(parsed), [[], [], [], []])
+
+    def test_double_quoted_objects(self):
+        column = pd.Series(['["o1", "o 2"]', '{"o3"}'])
+        parsed = _parse_object_column(column)
+        self.assertEqual(list(parsed), [['o1', 'o 2'], {'o3'}])
+
+    def test_other_literals_fall_back_to_literal_eval(self):
+        column = pd.Series(['["o1", \'o2\']', "[1, 2]", "['o3']"])
+        parsed = _parse_object_column(column)
+        self.assertEqual(list(parsed), [['o1', 'o2'], [1, 2], ['o3']])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -347,6 +347,53 @@ class TestTemplateRelationFiltering(unittest.TestCase):
         self.assertGreaterEqual(len(nested_obj.nestedgroups), 0)  # 0 if no nesting found, ≥1 if found
         self.assertTrue(isinstance(updated, OCDCRGraph))
 
+    def test_create_nestings_for_subgraphs_renamed_groups_are_indexed(self):
+        graph = DCRGraph()
+        for activity in "ABCDE":
+            graph.add_event(activity)
+        # A and D exclude the same events, B and C share a response to E, so groups get nested
+        for source in "AD":
+            for target in "BCE":
+                graph.add_relation(source, target, RelationTyps.E)
+        for source in "BC":
+            graph.add_relation(source, "E", RelationTyps.R)
+
+        oc_dcr = OCDCRGraph()
+        oc_dcr.objects["myType"] = OCDCRObject(spawn=graph.get_event("A"), type="myType", dcr=graph)
+        oc_dcr.update_activities()
+
+        nested_obj = GraphOptimizations.create_nestings_for_subgraphs(oc_dcr).objects["myType"]
+
+        self.assertTrue(nested_obj.nestedgroups)
+        for group in nested_obj.nestedgroups:
+            self.assertTrue(group.activity.endswith("_myType"))
+            self.assertIn(group, nested_obj.events)
+            self.assertIs(nested_obj.get_event(group.activity), group)
+        for rel in nested_obj.relations:
+            self.assertIsNotNone(nested_obj.get_relation(rel.start_event, rel.target_event, rel.type))
+
+    def test_rename_template_events(self):
+        template = {
+            'events': {'A', 'B', 'Group1'},
+            'marking': {'executed': set(), 'pending': {'Group1'}, 'included': {'A', 'B', 'Group1'}},
+            'includesTo': {},
+            'excludesTo': {'Group1': {'A'}},
+            'responseTo': {'A': {('Group1', 'ONE', 'ONE')}},
+            'conditionsFor': {},
+            'nestedgroups': {'Group1': {'B'}},
+            'nestedgroupsMap': {'B': 'Group1'},
+        }
+
+        renamed = GraphOptimizations.rename_template_events(template, {'Group1': 'Group1_T'})
+
+        self.assertEqual(renamed['events'], {'A', 'B', 'Group1_T'})
+        self.assertEqual(renamed['marking']['pending'], {'Group1_T'})
+        self.assertEqual(renamed['marking']['included'], {'A', 'B', 'Group1_T'})
+        self.assertEqual(renamed['excludesTo'], {'Group1_T': {'A'}})
+        self.assertEqual(renamed['responseTo'], {'A': {('Group1_T', 'ONE', 'ONE')}})
+        self.assertEqual(renamed['nestedgroups'], {'Group1_T': {'B'}})
+        self.assertEqual(renamed['nestedgroupsMap'], {'B': 'Group1_T'})
+
 
 if __name__ == '__main__':
     unittest.main()
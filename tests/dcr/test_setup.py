@@ -9,14 +9,19 @@ from ocpa.objects.log.importer.ocel import factory as ocel_import_factory
 
 import unittest
 import polars as pl
+from polars.testing import assert_frame_equal
 from ocpa.algo.discovery.oc_dcr.util import DiscoverData
 from ocpa.objects.oc_dcr_graph import IN_TOP_GRAPH
 
 RESULTS_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '../../sample_logs/'))
 
 class SetUpOCDCRTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # the test log is only read by the tests, import it once per test class
+        cls.ocel = ocel_import_factory.apply(os.path.join(RESULTS_DIR, "jsonocel/test_log.jsonocel"))
+
     def setUp(self):
-        self.ocel = ocel_import_factory.apply(os.path.join(RESULTS_DIR, "jsonocel/test_log.jsonocel"))
         self.spawn_mapping = {
             "Order": "Create Order",
             "Item": "Add Item"
@@ -48,9 +53,5 @@ class SetUpOCDCRTest(unittest.TestCase):
         ]).sort(["case:concept:name", "time:timestamp"])
 
         self.assertEqual(actual_df.shape, expected_df.shape, "DataFrame shape mismatch")
-        self.assertEqual(
-            actual_df.shape, expected_df.shape,
-            "Mismatch in number of rows/columns"
-        )
-        for row_actual, row_expected in zip(actual_df.iter_rows(named=True), expected_df.iter_rows(named=True)):
-            self.assertEqual(row_actual, row_expected, f"Row mismatch: {row_actual} != {row_expected}")
\ No newline at end of file
+        # compare the sorted frames column-wise instead of row by row in Python
+        assert_frame_equal(actual_df, expected_df, check_column_order=False, check_dtypes=False)
\ No newline at end of file
@@ -2,6 +2,9 @@ import unittest
 
 from ocpa.objects.oc_dcr_graph import DCRGraph, OCDCRGraph, OCDCRObject, Event, RelationTyps, MarkingTyps
 import ocpa.visualization.oc_dcr_vis.visualizer as viz
+from ocpa.visualization.oc_dcr_vis.variants.utils_viz import initialize_graph, add_events, is_same_hierarchy, \
+    add_relation_edge, get_edge_attrs
+from ocpa.util.dcr.converter import dcr_template, ocdcr_template, new_dcr_template, new_ocdcr_template, OCDCRConverter
 
 class TestDCRGraphStringRepresentation(unittest.TestCase):
 
@@ -33,6 +36,43 @@ class TestDCRGraphStringRepresentation(unittest.TestCase):
         expected_events = {'Event1', 'Event2', 'Event3', 'Event4', 'Event5', 'Event6', 'Event7', 'Event8'}
         self.assertEqual(set(self.string_representation['events']), expected_events)
 
+    def test_visualization_adds_each_group_once(self):
+        graph, _ = initialize_graph()
+        # Event3 and Event5 are in different branches below the group Event2
+        events = [self.graph.get_event('Event3'), self.graph.get_event('Event5')]
+        add_events(events, graph, self.graph.nestedgroups, self.graph.nestedgroups, self.graph.marking)
+        self.assertEqual(graph.source.count('subgraph cluster_Event2 '), 1)
+        self.assertEqual(graph.source.count('subgraph cluster_Event4 '), 1)
+
+    def test_same_hierarchy(self):
+        ancestors = {}
+        event2, event3, event5 = (self.graph.get_event(a) for a in ('Event2', 'Event3', 'Event5'))
+        self.assertTrue(is_same_hierarchy(event5, event2, ancestors))
+        self.assertTrue(is_same_hierarchy(event2, event5, ancestors))
+        self.assertTrue(is_same_hierarchy(event2, event2, ancestors))
+        self.assertFalse(is_same_hierarchy(event3, event5, ancestors))
+
+    def test_relation_edge_matches_graphviz_edge(self):
+        for edge_attrs in ({"headlabel": "% ∀", "lhead": "cluster_Event 2"}, {"arrowhead": "none"}):
+            attrs = get_edge_attrs(RelationTyps.E)
+            attrs.update(edge_attrs)
+            graph, _ = initialize_graph()
+            expected, _ = initialize_graph()
+            add_relation_edge(graph, 'Event 1', 'Event2', RelationTyps.E, attrs)
+            expected.edge('Event 1', 'Event2', **attrs)
+            line, expected_line = graph.body[0].strip(), expected.body[0].strip()
+            self.assertTrue(line.startswith('"Event 1" -> Event2 ['))
+            self.assertEqual(sorted(line[line.index('[') + 1:-1].split(' ')),
+                             sorted(expected_line[expected_line.index('[') + 1:-1].split(' ')))
+
+    def test_new_template_is_fresh(self):
+        template = new_dcr_template()
+        self.assertEqual(template, dcr_template)
+        template['events'].add('Event1')
+        template['marking']['included'].add('Event1')
+        self.assertEqual(new_dcr_template(), dcr_template)
+        self.assertEqual(new_ocdcr_template(), ocdcr_template)
+
     def test_marking(self):
         self.assertEqual(set(self.string_representation['marking']['pending']), {'Event6', 'Event8'})
         self.assertIn('Event1', self.string_representation['marking']['included'])
@@ -139,5 +179,14 @@ class TestOCDCRGraphStringRepresentation(unittest.TestCase):
         self.assertIn('Object1', self.graph_dict['spawnRelations'].get('Create1', set()))
         self.assertIn('Object2', self.graph_dict['spawnRelations'].get('Create2', set()))
 
+    def test_visualization_keeps_graph(self):
+        before = OCDCRConverter.to_string_representation(self.graph)
+        events, relations = self.graph.get_events(), self.graph.get_all_relations()
+        gviz = viz.apply(self.graph)
+        self.assertIn('Object1_Event1', gviz.source)
+        self.assertEqual(OCDCRConverter.to_string_representation(self.graph), before)
+        self.assertEqual(self.graph.get_events(), events)
+        self.assertEqual(self.graph.get_all_relations(), relations)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file